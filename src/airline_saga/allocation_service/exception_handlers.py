@@ -1,9 +1,8 @@
 """Exception handlers for the allocation service."""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 
-from airline_saga.common.models import TransactionStatus
+from airline_saga.common.responses import error_response
 from airline_saga.common.exceptions import (
     SagaException,
     AllocationFailedException,
@@ -13,53 +12,32 @@ from airline_saga.common.exceptions import (
 
 async def saga_exception_handler(_: Request, exc: SagaException):
     """Generic handler for all saga exceptions."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+    return error_response(500, exc)
 
 
 async def allocation_failed_exception_handler(
     _: Request, exc: AllocationFailedException
 ):
     """Handler for allocation failed exceptions."""
-    return JSONResponse(
-        status_code=400,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+    return error_response(400, exc)
 
 
 async def booking_not_found_exception_handler(
     _: Request, exc: BookingNotFoundException
 ):
     """Handler for booking not found exceptions."""
-    return JSONResponse(
-        status_code=404,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+    return error_response(404, exc)
+
+
+# Handlers in registration order, from the generic base to the specific exceptions
+_EXCEPTION_HANDLERS = (
+    (SagaException, saga_exception_handler),
+    (AllocationFailedException, allocation_failed_exception_handler),
+    (BookingNotFoundException, booking_not_found_exception_handler),
+)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers for the allocation service."""
-    app.add_exception_handler(SagaException, saga_exception_handler)
-    app.add_exception_handler(
-        AllocationFailedException, allocation_failed_exception_handler
-    )
-    app.add_exception_handler(
-        BookingNotFoundException, booking_not_found_exception_handler
-    )
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
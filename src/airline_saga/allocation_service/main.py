@@ -1,12 +1,23 @@
 """Allocation Service API implementation."""
 
-from typing import Dict
-import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
+from functools import lru_cache
+import secrets
 from datetime import datetime, timedelta
-from fastapi import FastAPI
-
-from airline_saga.common.models import TransactionStatus, TransactionResult
+import orjson
+from fastapi import FastAPI, Response
+
+from airline_saga.common.models import (
+    STATUS_COMPLETED,
+    STATUS_RELEASED,
+    TransactionResult,
+    TransactionResultPayload,
+)
 from airline_saga.common.config import AllocationServiceSettings
+from airline_saga.common.responses import ORJSONResponse
+from airline_saga.common.store import ShardedStore
+from airline_saga.common.utils import utc_now_isoformat
 from airline_saga.common.exceptions import (
     BookingNotFoundException,
 )
@@ -22,43 +33,58 @@ from airline_saga.allocation_service.exception_handlers import (
 )
 
 app: FastAPI = FastAPI(
-    title="Allocation Service", description="Service for allocating seats"
+    title="Allocation Service",
+    description="Service for allocating seats",
+    default_response_class=ORJSONResponse,
 )
 
 # Register exception handlers
 register_exception_handlers(app)
 
-# In-memory database for simplicity
-allocations_db: Dict[str, Allocation] = {}
-allocation_by_booking_id: Dict[str, str] = {}  # booking_id -> allocation_id
+# In-memory database for simplicity, keyed by booking_id
+allocations_db: ShardedStore[Allocation] = ShardedStore()
+
 
 # Sample gate assignments
-gates = {
-    "FL001": "B12",
-    "FL002": "C05",
-    "FL003": "A22",
-}
+gates: Mapping[str, str] = MappingProxyType(
+    {
+        "FL001": "B12",
+        "FL002": "C05",
+        "FL003": "A22",
+    },
+)
 
 # Sample boarding times (2 hours from now)
-boarding_times = {
-    "FL001": (datetime.now() + timedelta(hours=2)).isoformat(),
-    "FL002": (datetime.now() + timedelta(hours=3)).isoformat(),
-    "FL003": (datetime.now() + timedelta(hours=4)).isoformat(),
-}
+boarding_times: Mapping[str, str] = MappingProxyType(
+    {
+        "FL001": (datetime.now() + timedelta(hours=2)).isoformat(),
+        "FL002": (datetime.now() + timedelta(hours=3)).isoformat(),
+        "FL003": (datetime.now() + timedelta(hours=4)).isoformat(),
+    },
+)
 
+# Boarding time for flights without a scheduled one, captured at startup
+_DEFAULT_BOARDING_TIME = utc_now_isoformat()
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> AllocationServiceSettings:
-    """Get service settings."""
+    """Get service settings, built once per process."""
     return AllocationServiceSettings()
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse, response_model=None)
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
 
-@app.post("/api/allocations/allocate")
+@app.post(
+    "/api/allocations/allocate",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": TransactionResult}},
+)
 async def allocate_seat(request: AllocateSeatRequest):
     """
     Allocate a seat for a booking.
@@ -70,35 +96,22 @@ async def allocate_seat(request: AllocateSeatRequest):
         Transaction result
     """
     booking_id = request.booking_id
-
     # Check if allocation already exists for this booking
-    if booking_id in allocation_by_booking_id:
-        existing_allocation_id = allocation_by_booking_id[booking_id]
-        existing_allocation = allocations_db[existing_allocation_id]
+    existing_allocation = allocations_db.get(booking_id)
 
-        # If allocation is already completed, return success
-        if existing_allocation.status == AllocationStatus.ALLOCATED:
-            return TransactionResult(
-                success=True,
-                booking_id=booking_id,
-                status=TransactionStatus.COMPLETED,
-                message="Seat already allocated",
-                data={
-                    "allocation_id": existing_allocation_id,
-                    "boarding_pass": existing_allocation.boarding_pass.dict()
-                    if existing_allocation.boarding_pass
-                    else None,
-                },
-            )
+    # If allocation is already completed, serve its pre-encoded response
+    if existing_allocation and existing_allocation.status == AllocationStatus.ALLOCATED:
+        return Response(
+            existing_allocation._duplicate_response,
+            media_type="application/json",
+        )
 
     # Generate an allocation ID
-    allocation_id = f"alloc_{str(uuid.uuid4())[:8]}"
+    allocation_id = f"alloc_{secrets.token_hex(4)}"
 
     # Get gate and boarding time for the flight
     gate = gates.get(request.flight_number, "Gate TBD")
-    boarding_time = boarding_times.get(
-        request.flight_number, datetime.utcnow().isoformat()
-    )
+    boarding_time = boarding_times.get(request.flight_number, _DEFAULT_BOARDING_TIME)
 
     # Create boarding pass
     boarding_pass = BoardingPass(
@@ -120,20 +133,42 @@ async def allocate_seat(request: AllocateSeatRequest):
         boarding_pass=boarding_pass,
     )
 
+    data = {
+        "allocation_id": allocation_id,
+        "boarding_pass": boarding_pass.model_dump(),
+    }
+
+    # Encode the response for retries of this booking once, up front
+    allocation._duplicate_response = orjson.dumps(
+        TransactionResultPayload(
+            success=True,
+            booking_id=booking_id,
+            status=STATUS_COMPLETED,
+            message="Seat already allocated",
+            data=data,
+        ).to_dict(),
+    )
+
     # Store allocation
-    allocations_db[allocation_id] = allocation
-    allocation_by_booking_id[booking_id] = allocation_id
+    allocations_db[booking_id] = allocation
 
-    return TransactionResult(
-        success=True,
-        booking_id=booking_id,
-        status=TransactionStatus.COMPLETED,
-        message="Seat allocated successfully",
-        data={"allocation_id": allocation_id, "boarding_pass": boarding_pass.dict()},
+    return ORJSONResponse(
+        TransactionResultPayload(
+            success=True,
+            booking_id=booking_id,
+            status=STATUS_COMPLETED,
+            message="Seat allocated successfully",
+            data=data,
+        ).to_dict(),
     )
 
 
-@app.post("/api/allocations/cancel")
+@app.post(
+    "/api/allocations/cancel",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": TransactionResult}},
+)
 async def cancel_allocation(request: CancelAllocationRequest):
     """
     Cancel a seat allocation.
@@ -145,44 +180,39 @@ async def cancel_allocation(request: CancelAllocationRequest):
         Transaction result
     """
     booking_id = request.booking_id
-
     # Check if allocation exists for this booking
-    if booking_id not in allocation_by_booking_id:
+    allocation = allocations_db.get(booking_id)
+    if allocation is None:
         raise BookingNotFoundException(
-            f"No allocation found for booking {booking_id}", booking_id=booking_id
+            f"No allocation found for booking {booking_id}",
+            booking_id=booking_id,
         )
 
-    allocation_id = allocation_by_booking_id[booking_id]
-    allocation = allocations_db[allocation_id]
-
     # Check if allocation can be cancelled
     if allocation.status == AllocationStatus.CANCELLED:
-        return TransactionResult(
-            success=True,
-            booking_id=booking_id,
-            status=TransactionStatus.RELEASED,
-            message="Allocation already cancelled",
+        return ORJSONResponse(
+            TransactionResultPayload(
+                success=True,
+                booking_id=booking_id,
+                status=STATUS_RELEASED,
+                message="Allocation already cancelled",
+            ).to_dict(),
         )
 
     # Update allocation status
     allocation.status = AllocationStatus.CANCELLED
-    allocations_db[allocation_id] = allocation
 
-    return TransactionResult(
-        success=True,
-        booking_id=booking_id,
-        status=TransactionStatus.RELEASED,
-        message="Allocation cancelled successfully",
+    return ORJSONResponse(
+        TransactionResultPayload(
+            success=True,
+            booking_id=booking_id,
+            status=STATUS_RELEASED,
+            message="Allocation cancelled successfully",
+        ).to_dict(),
     )
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    settings = get_settings()
-    uvicorn.run(
-        "airline_saga.allocation_service.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-    )
+    from airline_saga.common.uvicorn_config import run_service
+
+    run_service("airline_saga.allocation_service.main:app", get_settings())
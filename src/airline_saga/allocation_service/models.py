@@ -3,10 +3,10 @@
 from typing import Optional
 import enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 
-class AllocationStatus(str, enum.Enum):
+class AllocationStatus(enum.StrEnum):
     """Status of a seat allocation."""
 
     PENDING = "PENDING"
@@ -18,6 +18,8 @@ class AllocationStatus(str, enum.Enum):
 class AllocateSeatRequest(BaseModel):
     """Request to allocate a seat."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     booking_id: str
     flight_number: str
     seat_number: str
@@ -27,12 +29,16 @@ class AllocateSeatRequest(BaseModel):
 class CancelAllocationRequest(BaseModel):
     """Request to cancel a seat allocation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     booking_id: str
 
 
 class BoardingPass(BaseModel):
     """Model representing a boarding pass."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     passenger: str
     flight: str
     seat: str
@@ -43,6 +49,8 @@ class BoardingPass(BaseModel):
 class Allocation(BaseModel):
     """Model representing a seat allocation."""
 
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     allocation_id: str
     booking_id: str
     flight_number: str
@@ -50,3 +58,6 @@ class Allocation(BaseModel):
     passenger_name: str
     status: AllocationStatus
     boarding_pass: Optional[BoardingPass] = None
+
+    # Encoded "already allocated" response, served on duplicate requests
+    _duplicate_response: Optional[bytes] = PrivateAttr(default=None)
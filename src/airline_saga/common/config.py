@@ -1,7 +1,9 @@
 """Configuration settings for the airline saga pattern implementation."""
 
-from pydantic_settings import BaseSettings
-from pydantic import field_validator
+from dataclasses import dataclass
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
 from typing import List
 
 
@@ -15,17 +17,17 @@ class ServiceSettings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
 
+    # Server process settings; reload is opt-in and only applies to a single worker
+    workers: int = 1
+    reload: bool = False
+
     # Service URLs
     seat_service_url: str = "http://localhost:8001"
     payment_service_url: str = "http://localhost:8002"
     allocation_service_url: str = "http://localhost:8003"
     orchestrator_url: str = "http://localhost:8000"
 
-    class Config:
-        """Pydantic configuration."""
-
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
 class SeatServiceSettings(ServiceSettings):
@@ -49,6 +51,30 @@ class AllocationServiceSettings(ServiceSettings):
     port: int = 8003
 
 
+@dataclass(frozen=True)
+class OrchestratorUrls:
+    """Endpoints of the downstream services called by the orchestrator."""
+
+    seat_block: str
+    seat_release: str
+    payment_process: str
+    payment_refund: str
+    allocation_allocate: str
+    allocation_cancel: str
+
+    @classmethod
+    def from_settings(cls, settings: ServiceSettings) -> "OrchestratorUrls":
+        """Build the endpoints from the service base URLs."""
+        return cls(
+            seat_block=f"{settings.seat_service_url}/api/seats/block",
+            seat_release=f"{settings.seat_service_url}/api/seats/release",
+            payment_process=f"{settings.payment_service_url}/api/payments/process",
+            payment_refund=f"{settings.payment_service_url}/api/payments/refund",
+            allocation_allocate=f"{settings.allocation_service_url}/api/allocations/allocate",
+            allocation_cancel=f"{settings.allocation_service_url}/api/allocations/cancel",
+        )
+
+
 class OrchestratorSettings(ServiceSettings):
     """Settings for the orchestrator."""
 
@@ -56,6 +82,30 @@ class OrchestratorSettings(ServiceSettings):
     port: int = 8000
     commands: List[str] = ["SEAT", "PAYMENT", "ALLOCATION"]
 
+    # Downstream call timeouts in seconds, and retries on connection errors;
+    # every call makes at least one attempt
+    http_connect_timeout: float = Field(default=2.0, gt=0)
+    http_read_timeout: float = Field(default=5.0, gt=0)
+    http_write_timeout: float = Field(default=5.0, gt=0)
+    http_pool_timeout: float = Field(default=2.0, gt=0)
+    http_call_timeout: float = Field(default=10.0, gt=0)
+    http_retry_attempts: int = Field(default=2, ge=1)
+    http_retry_backoff: float = Field(default=0.05, gt=0)
+
+    # Maximum number of booking and cancellation sagas running at once
+    max_concurrent_sagas: int = 64
+
+    # Seconds to wait for in-flight sagas on shutdown before cancelling them
+    saga_shutdown_timeout: float = 30.0
+
+    # Build downstream results without validation, trusting the peer services
+    trust_internal_services: bool = True
+
+    @cached_property
+    def urls(self) -> OrchestratorUrls:
+        """Downstream endpoints, built once per settings instance."""
+        return OrchestratorUrls.from_settings(self)
+
     @field_validator("commands", mode="before")
     @classmethod
     def parse_commands(cls, v):
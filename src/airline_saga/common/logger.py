@@ -3,17 +3,22 @@ import sys
 import logging
 from fastapi import FastAPI
 
+# Known logging level names, resolved once at import
+_LEVELS = frozenset(logging.getLevelNamesMapping())
+
 
 def config_logger(service_name: str, level: str = "INFO") -> Logger:
     # Validate logging level
-    if level.upper() not in logging.getLevelNamesMapping():
+    if level.upper() not in _LEVELS:
         raise ValueError(f"Logging level unknown: {level}")
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    # Configure the root logger only once per process
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=level,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            handlers=[logging.StreamHandler(sys.stdout)],
+        )
 
     logger = logging.getLogger(service_name)
 
@@ -31,18 +36,25 @@ def setup_request_logging(app: FastAPI, logger: logging.Logger) -> None:
         logger: The logger instance
     """
 
+    info = logger.info
+
     @app.middleware("http")
     async def log_requests(request, call_next):
         """Log incoming requests and outgoing responses."""
+        # Skip building the log records entirely when INFO is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return await call_next(request)
+
+        method = request.method
+        path = request.url.path
+
         # Log the request
-        logger.info(f"Request: {request.method} {request.url.path}")
+        info("Request: %s %s", method, path)
 
         # Process the request
         response = await call_next(request)
 
         # Log the response
-        logger.info(
-            f"Response: {request.method} {request.url.path} - Status: {response.status_code}"
-        )
+        info("Response: %s %s - Status: %s", method, path, response.status_code)
 
         return response
@@ -1,13 +1,15 @@
 """Data models for the airline booking saga pattern."""
 
 import enum
+import sys
 import uuid
-from typing import Dict, Optional, Any, List
+from dataclasses import dataclass
+from typing import Dict, Final, Optional, Any, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class TransactionStatus(str, enum.Enum):
+class TransactionStatus(enum.StrEnum):
     """Status of a transaction in the saga pattern."""
 
     PENDING = "PENDING"
@@ -18,17 +20,78 @@ class TransactionStatus(str, enum.Enum):
     CANCELLED = "CANCELLED"
 
 
+# Interned plain-string status values shared by TransactionStatus and BookingStatus,
+# used when building response payloads directly instead of through the enums
+STATUS_PENDING: Final[str] = sys.intern(TransactionStatus.PENDING.value)
+STATUS_COMPLETED: Final[str] = sys.intern(TransactionStatus.COMPLETED.value)
+STATUS_FAILED: Final[str] = sys.intern(TransactionStatus.FAILED.value)
+STATUS_RELEASED: Final[str] = sys.intern(TransactionStatus.RELEASED.value)
+STATUS_REFUNDED: Final[str] = sys.intern(TransactionStatus.REFUNDED.value)
+STATUS_CANCELLED: Final[str] = sys.intern(TransactionStatus.CANCELLED.value)
+
+
 class TransactionResult(BaseModel):
     """Result of a transaction in the saga pattern."""
 
+    # Results are never mutated once received; unknown fields from downstream
+    # services are ignored rather than rejected
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     booking_id: str
     status: TransactionStatus
     message: str = ""
     data: Optional[Dict[str, Any]] = None
 
+    @classmethod
+    def from_trusted(cls, payload: Dict[str, Any]) -> "TransactionResult":
+        """
+        Build a result from a reply of one of the saga services, skipping validation.
+
+        Args:
+            payload: The decoded JSON body of the reply
+
+        Returns:
+            The transaction result
+        """
+        return cls.model_construct(
+            success=payload["success"],
+            booking_id=payload["booking_id"],
+            status=TransactionStatus(payload["status"]),
+            message=payload.get("message", ""),
+            data=payload.get("data"),
+        )
+
+
+@dataclass(slots=True)
+class TransactionResultPayload:
+    """
+    Unvalidated counterpart of TransactionResult for building responses.
+
+    Services use it to assemble results they encode themselves, keeping
+    TransactionResult for parsing and for the OpenAPI schema.
+    """
+
+    success: bool
+    booking_id: str
+    status: str
+    message: str = ""
+    data: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the payload into a JSON-serializable dict."""
+        return {
+            "success": self.success,
+            "booking_id": self.booking_id,
+            "status": self.status,
+            "message": self.message,
+            "data": self.data,
+        }
+
 
-class SeatStatus(str, enum.Enum):
+# A StrEnum, so seat statuses compare by identity once Pydantic has resolved
+# them to members, and format as their plain value
+class SeatStatus(enum.StrEnum):
     """Status of a seat in the airline booking system."""
 
     AVAILABLE = "available"
@@ -36,7 +99,7 @@ class SeatStatus(str, enum.Enum):
     BOOKED = "booked"
 
 
-class PaymentMethodType(str, enum.Enum):
+class PaymentMethodType(enum.StrEnum):
     """Types of payment methods."""
 
     CREDIT_CARD = "credit_card"
@@ -45,7 +108,7 @@ class PaymentMethodType(str, enum.Enum):
     CRYPTO = "crypto"
 
 
-class PaymentStatus(str, enum.Enum):
+class PaymentStatus(enum.StrEnum):
     """Status of a payment transaction."""
 
     PENDING = "PENDING"
@@ -54,7 +117,7 @@ class PaymentStatus(str, enum.Enum):
     REFUNDED = "REFUNDED"
 
 
-class BookingStatus(str, enum.Enum):
+class BookingStatus(enum.StrEnum):
     """Status of a booking in the system."""
 
     PENDING = "PENDING"
@@ -63,7 +126,11 @@ class BookingStatus(str, enum.Enum):
     CANCELLED = "CANCELLED"
 
 
-class BookingStep(BaseModel):
+# Steps are immutable values kept for every booking, so they are a slotted
+# dataclass rather than a model; Pydantic still validates and serializes them
+# as part of the models that contain them
+@dataclass(slots=True, frozen=True)
+class BookingStep:
     """A step in the booking process."""
 
     service: str
@@ -0,0 +1,42 @@
+"""Response classes shared by the airline saga services."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from airline_saga.common.exceptions import SagaException
+from airline_saga.common.models import STATUS_FAILED
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Error response body shared by all services, copied and filled in per error
+_ERROR_TEMPLATE = {
+    "success": False,
+    "booking_id": None,
+    "status": STATUS_FAILED,
+    "message": "",
+}
+
+
+def error_response(status_code: int, exc: SagaException) -> ORJSONResponse:
+    """
+    Build the error response returned for a saga exception.
+
+    Args:
+        status_code: HTTP status code of the error response
+        exc: The saga exception
+
+    Returns:
+        The error response
+    """
+    content = _ERROR_TEMPLATE.copy()
+    content["booking_id"] = exc.booking_id
+    content["message"] = exc.message
+    return ORJSONResponse(status_code=status_code, content=content)
@@ -0,0 +1,61 @@
+"""In-memory key-value store shared by the airline saga services."""
+
+from collections.abc import Iterator
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class ShardedStore(Generic[V]):
+    """
+    In-memory store keyed by booking ID, striped across shards.
+
+    Keeping each shard small bounds the cost of a dict resize to one shard as
+    the store grows. There are no locks: the services run on a single event
+    loop and never await between reading and updating a stored value, so
+    every check-then-act is already atomic.
+    """
+
+    def __init__(self, shard_count: int = 16):
+        """
+        Initialize the store.
+
+        Args:
+            shard_count: Number of shards, must be a power of two
+
+        Raises:
+            ValueError: If the shard count is not a power of two
+        """
+        if shard_count <= 0 or shard_count & (shard_count - 1):
+            raise ValueError(f"Shard count must be a power of two: {shard_count}")
+
+        self._mask = shard_count - 1
+        self._shards: List[Dict[str, V]] = [{} for _ in range(shard_count)]
+
+    def _shard(self, key: str) -> Dict[str, V]:
+        """Get the shard holding a key."""
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: str) -> Optional[V]:
+        """Get a value, or None if it does not exist."""
+        return self._shard(key).get(key)
+
+    def items(self) -> List[Tuple[str, V]]:
+        """Get a snapshot of all the items across the shards."""
+        return [item for shard in self._shards for item in shard.items()]
+
+    def __getitem__(self, key: str) -> V:
+        return self._shard(key)[key]
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._shard(key)[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._shard(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._shards:
+            yield from shard
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
@@ -1,7 +1,8 @@
 """Utility functions for the airline saga pattern implementation."""
 
+import secrets
+import time
 import uuid
-from datetime import datetime
 from typing import Dict, Any
 
 from airline_saga.common.models import TransactionStatus, BookingStep
@@ -9,7 +10,19 @@ from airline_saga.common.models import TransactionStatus, BookingStep
 
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID with an optional prefix."""
-    return f"{prefix}_{str(uuid.uuid4())[:8]}" if prefix else str(uuid.uuid4())
+    return f"{prefix}_{secrets.token_hex(4)}" if prefix else str(uuid.uuid4())
+
+
+def utc_now_isoformat() -> str:
+    """Get the current UTC time as an ISO 8601 string with microseconds."""
+    now = time.time()
+    seconds = int(now)
+    tm = time.gmtime(seconds)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        f".{int((now - seconds) * 1_000_000):06d}"
+    )
 
 
 def create_booking_step(
@@ -20,7 +33,7 @@ def create_booking_step(
         service=service,
         operation=operation,
         status=status,
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=utc_now_isoformat(),
     )
 
 
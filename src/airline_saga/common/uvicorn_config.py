@@ -0,0 +1,35 @@
+"""Uvicorn runtime configuration shared by the airline saga services."""
+
+from airline_saga.common.config import ServiceSettings
+
+# Let uvicorn pick the uvloop event loop and httptools parser when
+# ``uvicorn[standard]`` installed them, falling back to asyncio and h11 on
+# platforms without them (Windows, PyPy)
+UVICORN_LOOP = "auto"
+UVICORN_HTTP = "auto"
+
+
+def run_service(app: str, settings: ServiceSettings) -> None:
+    """
+    Run a service application with uvicorn.
+
+    With more than one worker, uvicorn binds the listening socket once and
+    shares it across the worker processes, so the kernel spreads incoming
+    connections over all of them. Auto-reload is a development feature and is
+    only enabled for a single worker.
+
+    Args:
+        app: Import path of the FastAPI application, e.g. ``package.module:app``
+        settings: The service settings providing host, port, workers and reload
+    """
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        reload=settings.reload and settings.workers == 1,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+    )
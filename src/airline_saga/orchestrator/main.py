@@ -1,19 +1,23 @@
 """Orchestrator Service API implementation."""
 
-from typing import Dict, List
+from collections.abc import AsyncIterator, Coroutine
+from typing import Any, Dict, List, Optional, Set
 from httpx import Response
 
+import asyncio
 import uuid
+from functools import lru_cache
 import httpx
-from fastapi import FastAPI, BackgroundTasks
+import orjson
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
 
-from airline_saga.common.models import BookingStatus, BookingStep, TransactionResult
+from airline_saga.common.models import BookingStatus, BookingStep
 from airline_saga.common.config import OrchestratorSettings
+from airline_saga.common.responses import ORJSONResponse
+from airline_saga.common.store import ShardedStore
 from airline_saga.orchestrator.models import PaymentDetails
-from airline_saga.common.exceptions import (
-    OrchestratorException,
-    BookingNotFoundException,
-)
+from airline_saga.common.exceptions import BookingNotFoundException
 from airline_saga.orchestrator.models import (
     StartBookingRequest,
     StartBookingResponse,
@@ -25,14 +29,57 @@ from airline_saga.orchestrator.services.commands import (
     OrchestratorCommand,
     OrchestratorCommandArgs,
 )
+from airline_saga.orchestrator.services.http import (
+    downstream_timeout,
+    parse_result,
+    post_json,
+)
 from airline_saga.orchestrator.services.commands.command_factory import (
     OrchestratorCommandFactory,
 )
 from airline_saga.common.logger import setup_request_logging
 from airline_saga.orchestrator import logger, SERVICE_NAME
 
+
+@asynccontextmanager
+async def setup_teardown_lifespan(app: FastAPI):
+    # Single pooled client shared by every downstream call, so connections to
+    # the services are kept alive and reused across sagas. HTTP/2 is negotiated
+    # over TLS, letting calls to the same host share one multiplexed connection
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200,
+            keepalive_expiry=30.0,
+        ),
+        timeout=downstream_timeout(get_settings()),
+    )
+    # Sagas running in the background, so shutdown can wait for them
+    app.state.saga_tasks = set()
+
+    yield
+
+    # Let in-flight sagas finish before closing the client they use, cancelling
+    # the ones still running once the timeout expires
+    saga_tasks: Set[asyncio.Task] = app.state.saga_tasks
+    if saga_tasks:
+        logger.info(f"Waiting for {len(saga_tasks)} in-flight sagas to finish")
+        _, pending = await asyncio.wait(
+            saga_tasks, timeout=get_settings().saga_shutdown_timeout
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    await app.state.http_client.aclose()
+
+
 app: FastAPI = FastAPI(
-    title=SERVICE_NAME, description="Service for orchestrating the booking saga"
+    title=SERVICE_NAME,
+    description="Service for orchestrating the booking saga",
+    default_response_class=ORJSONResponse,
+    lifespan=setup_teardown_lifespan,
 )
 
 setup_request_logging(app, logger)
@@ -41,14 +88,52 @@ setup_request_logging(app, logger)
 register_exception_handlers(app)
 
 # In-memory database for simplicity
-bookings_db: Dict[str, BookingDetails] = {}
+bookings_db: ShardedStore[BookingDetails] = ShardedStore()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> OrchestratorSettings:
-    """Get service settings."""
+    """Get service settings, built once per process."""
     return OrchestratorSettings()
 
 
+# Caps the sagas running at once, so a burst of bookings queues here instead
+# of exhausting the connections to the downstream services
+saga_semaphore = asyncio.Semaphore(get_settings().max_concurrent_sagas)
+
+
+@asynccontextmanager
+async def saga_slot(booking_id: str) -> AsyncIterator[None]:
+    """
+    Wait for a free saga slot and hold it for the duration of the block.
+
+    Args:
+        booking_id: The booking ID the slot is taken for
+    """
+    if saga_semaphore.locked():
+        logger.warning(f"Saga limit reached, booking '{booking_id}' is waiting")
+    async with saga_semaphore:
+        yield
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all downstream calls."""
+    return app.state.http_client
+
+
+def start_saga(saga: Coroutine[Any, Any, None]) -> None:
+    """
+    Run a saga in the background, tracked until it finishes.
+
+    Args:
+        saga: The saga coroutine to run
+    """
+    saga_tasks: Set[asyncio.Task] = app.state.saga_tasks
+    task = asyncio.create_task(saga)
+    saga_tasks.add(task)
+    task.add_done_callback(saga_tasks.discard)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -56,21 +141,18 @@ async def health_check():
 
 
 @app.post("/api/bookings/start", response_model=StartBookingResponse)
-async def start_booking(
-    request: StartBookingRequest, background_tasks: BackgroundTasks
-):
+async def start_booking(request: StartBookingRequest):
     """
     Start a new booking process.
 
     Args:
         request: The booking request
-        background_tasks: FastAPI background tasks
 
     Returns:
         Booking response with booking ID
     """
     # Generate a booking ID
-    booking_id = str(uuid.uuid4())
+    booking_id = uuid.uuid4().hex
 
     # Create initial booking record
     booking = BookingDetails(
@@ -86,13 +168,14 @@ async def start_booking(
     bookings_db[booking_id] = booking
 
     # Start the booking process in the background
-    background_tasks.add_task(
-        process_booking,
-        booking_id=booking_id,
-        passenger_name=request.passenger_name,
-        flight_number=request.flight_number,
-        seat_number=request.seat_number,
-        payment_details=request.payment_details,
+    start_saga(
+        process_booking(
+            booking_id=booking_id,
+            passenger_name=request.passenger_name,
+            flight_number=request.flight_number,
+            seat_number=request.seat_number,
+            payment_details=request.payment_details,
+        )
     )
 
     return StartBookingResponse(
@@ -102,18 +185,28 @@ async def start_booking(
     )
 
 
-@app.get("/api/bookings", response_model=Dict[str, BookingDetails])
+@app.get(
+    "/api/bookings",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": Dict[str, BookingDetails]}},
+)
 async def get_all_booking():
     """
-    Get booking details.
+    Get the details of all bookings.
 
-    Args:
-        booking_id: The booking ID
+    The stored bookings are already validated models, so they are dumped and
+    encoded directly rather than revalidated against a response model.
 
     Returns:
-        Booking details
+        Booking details by booking ID
     """
-    return bookings_db
+    return ORJSONResponse(
+        {
+            booking_id: booking.model_dump()
+            for booking_id, booking in bookings_db.items()
+        }
+    )
 
 
 @app.get("/api/bookings/{booking_id}", response_model=BookingDetails)
@@ -127,33 +220,32 @@ async def get_booking(booking_id: str):
     Returns:
         Booking details
     """
-    if booking_id not in bookings_db:
+    booking = bookings_db.get(booking_id)
+    if booking is None:
         raise BookingNotFoundException(
             f"Booking {booking_id} not found", booking_id=booking_id
         )
 
-    return bookings_db[booking_id]
+    return booking
 
 
 @app.post("/api/bookings/{booking_id}/cancel", response_model=CancellationResponse)
-async def cancel_booking(booking_id: str, background_tasks: BackgroundTasks):
+async def cancel_booking(booking_id: str):
     """
     Cancel a booking.
 
     Args:
         booking_id: The booking ID
-        background_tasks: FastAPI background tasks
 
     Returns:
         Cancellation response
     """
-    if booking_id not in bookings_db:
+    booking = bookings_db.get(booking_id)
+    if booking is None:
         raise BookingNotFoundException(
             f"Booking {booking_id} not found", booking_id=booking_id
         )
 
-    booking = bookings_db[booking_id]
-
     # Check if booking can be cancelled
     if booking.status == BookingStatus.CANCELLED:
         return CancellationResponse(
@@ -165,10 +257,9 @@ async def cancel_booking(booking_id: str, background_tasks: BackgroundTasks):
 
     # Update booking status
     booking.status = BookingStatus.CANCELLED
-    bookings_db[booking_id] = booking
 
     # Start the cancellation process in the background
-    background_tasks.add_task(cancel_booking_process, booking_id=booking_id)
+    start_saga(cancel_booking_process(booking_id=booking_id))
 
     return CancellationResponse(
         booking_id=booking_id,
@@ -195,131 +286,139 @@ async def process_booking(
         seat_number: The seat number
         payment_details: The payment details
     """
-    settings = get_settings()
-    booking = bookings_db[booking_id]
-    command_factory = OrchestratorCommandFactory(
-        OrchestratorCommandArgs(
-            booking=booking,
-            passenger_name=passenger_name,
-            flight_number=flight_number,
-            seat_number=seat_number,
-            payment_details=payment_details,
-            settings=settings,
+    async with saga_slot(booking_id):
+        settings = get_settings()
+        booking = bookings_db[booking_id]
+        command_factory = OrchestratorCommandFactory(
+            OrchestratorCommandArgs(
+                booking=booking,
+                passenger_name=passenger_name,
+                flight_number=flight_number,
+                seat_number=seat_number,
+                payment_details=payment_details,
+                settings=settings,
+                http_client=get_http_client(),
+            )
         )
-    )
 
-    try:
-        to_do = [command_factory.get_command(command) for command in settings.commands]
-        to_revert: List[OrchestratorCommand] = []
-
-        # Dequeues commands to be executed sequentially and revert the executions if something fails.
-        # Workflow is pretty dumb as it doesn't support conditional branching, parallelization, loops, etc.
-        # After all, is a POC..
-        while to_do:
-            command = to_do.pop(0)
-            try:
-                await command.execute()
+        try:
+            to_revert: List[OrchestratorCommand] = []
+
+            # Builds and executes commands sequentially, only as they are reached,
+            # and reverts the executions if something fails, including building a
+            # later command.
+            # Workflow is pretty dumb as it doesn't support conditional branching,
+            # parallelization, loops, etc. After all, is a POC..
+            for command_name in settings.commands:
+                try:
+                    command = command_factory.get_command(command_name)
+                    await command.execute()
+                except Exception:
+                    # Revert the executed commands, most recent first
+                    for revert_command in reversed(to_revert):
+                        await revert_command.undo()
+                    raise
                 to_revert.append(command)
-            except OrchestratorException:
-                to_do.insert(0, command)
-                while to_revert:
-                    revert_command = to_revert.pop()
-                    await revert_command.undo()
-                    to_do.insert(0, command)
-                raise
-
-        # All steps completed successfully
-        booking.status = BookingStatus.COMPLETED
-        bookings_db[booking_id] = booking
 
-    except Exception as e:
-        logger.error(f"Something went wrong: {str(e)}")
-        # Handle any unexpected errors
-        booking.status = BookingStatus.FAILED
-        bookings_db[booking_id] = booking
-        # In a real implementation, we would log the error and possibly notify an admin
+            # All steps completed successfully
+            booking.status = BookingStatus.COMPLETED
 
+        except Exception as e:
+            logger.error(f"Something went wrong: {str(e)}")
+            # Handle any unexpected errors
+            booking.status = BookingStatus.FAILED
+            # In a real implementation, we would log the error and possibly
+            # notify an admin
 
-async def cancel_booking_process(booking_id: str):
+
+async def _run_compensation(
+    client: httpx.AsyncClient,
+    settings: OrchestratorSettings,
+    url: str,
+    booking_id: str,
+    service: str,
+    operation: str,
+) -> Optional[BookingStep]:
     """
-    Cancel a booking using compensating transactions.
+    Run a single compensating transaction for a booking cancellation.
 
     Args:
+        client: The shared HTTP client
+        settings: The service settings
+        url: The compensation endpoint of the downstream service
         booking_id: The booking ID
-    """
-    settings = get_settings()
-    booking = bookings_db[booking_id]
-    compensation_steps = []
-
-    # Step 1: Cancel allocation
-    try:
-        async with httpx.AsyncClient() as client:
-            allocation_response = await client.post(
-                f"{settings.allocation_service_url}/api/allocations/cancel",
-                json={"booking_id": booking_id},
-            )
+        service: Name of the downstream service
+        operation: Name of the compensating operation
 
-            if allocation_response.status_code == 200:
-                result = TransactionResult(**allocation_response.json())
-                compensation_steps.append(
-                    BookingStep(
-                        service="allocation_service",
-                        operation="cancel_allocation",
-                        status=result.status,
-                        timestamp=result.data.get("timestamp", ""),
-                    )
-                )
-    except Exception:
-        # Continue with other compensating transactions even if this one fails
-        pass
+    Returns:
+        The resulting booking step, or None if the service did not succeed
+    """
+    response = await post_json(
+        client,
+        url,
+        orjson.dumps({"booking_id": booking_id}),
+        settings,
+    )
+    if response.status_code != 200:
+        return None
+
+    result = parse_result(response, settings)
+    return BookingStep(
+        service=service,
+        operation=operation,
+        status=result.status,
+        timestamp=(result.data or {}).get("timestamp", ""),
+    )
 
-    # Step 2: Refund payment
-    try:
-        async with httpx.AsyncClient() as client:
-            payment_response = await client.post(
-                f"{settings.payment_service_url}/api/payments/refund",
-                json={"booking_id": booking_id},
-            )
 
-            if payment_response.status_code == 200:
-                result = TransactionResult(**payment_response.json())
-                compensation_steps.append(
-                    BookingStep(
-                        service="payment_service",
-                        operation="refund_payment",
-                        status=result.status,
-                        timestamp=result.data.get("timestamp", ""),
-                    )
-                )
-    except Exception:
-        # Continue with other compensating transactions even if this one fails
-        pass
+async def cancel_booking_process(booking_id: str):
+    """
+    Cancel a booking using compensating transactions.
 
-    # Step 3: Release seat
-    try:
-        async with httpx.AsyncClient() as client:
-            seat_response = await client.post(
-                f"{settings.seat_service_url}/api/seats/release",
-                json={"booking_id": booking_id},
-            )
+    The compensations do not depend on each other, so they run concurrently.
+    One failing does not stop the others; failed compensations are simply not
+    recorded as steps.
 
-            if seat_response.status_code == 200:
-                result = TransactionResult(**seat_response.json())
-                compensation_steps.append(
-                    BookingStep(
-                        service="seat_service",
-                        operation="release_seat",
-                        status=result.status,
-                        timestamp=result.data.get("timestamp", ""),
-                    )
-                )
-    except Exception:
-        # Continue even if this one fails
-        pass
+    Args:
+        booking_id: The booking ID
+    """
+    async with saga_slot(booking_id):
+        settings = get_settings()
+        client = get_http_client()
+        booking = bookings_db[booking_id]
+
+        results = await asyncio.gather(
+            _run_compensation(
+                client,
+                settings,
+                settings.urls.allocation_cancel,
+                booking_id,
+                service="allocation_service",
+                operation="cancel_allocation",
+            ),
+            _run_compensation(
+                client,
+                settings,
+                settings.urls.payment_refund,
+                booking_id,
+                service="payment_service",
+                operation="refund_payment",
+            ),
+            _run_compensation(
+                client,
+                settings,
+                settings.urls.seat_release,
+                booking_id,
+                service="seat_service",
+                operation="release_seat",
+            ),
+            return_exceptions=True,
+        )
 
-    # Update booking with compensation steps
-    booking.steps.extend(compensation_steps)
-    bookings_db[booking_id] = booking
+        # Update booking with compensation steps, in saga order
+        booking.steps.extend(
+            result for result in results if isinstance(result, BookingStep)
+        )
 
 
 async def compensate_seat_blocking(
@@ -334,12 +433,14 @@ async def compensate_seat_blocking(
     """
     logger.info(f"Releasing the seat for booking: {booking_id}")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.seat_service_url}/api/seats/release",
-                json={"booking_id": booking_id},
-            )
-            return response
+        client = get_http_client()
+        response = await post_json(
+            client,
+            settings.urls.seat_release,
+            orjson.dumps({"booking_id": booking_id}),
+            settings,
+        )
+        return response
     except Exception as e:
         logger.error(f"Error while releasing the seat: {str(e)}")
         raise
@@ -356,23 +457,19 @@ async def compensate_payment_processing(
         settings: The service settings
     """
     try:
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                f"{settings.payment_service_url}/api/payments/refund",
-                json={"booking_id": booking_id},
-            )
+        client = get_http_client()
+        await post_json(
+            client,
+            settings.urls.payment_refund,
+            orjson.dumps({"booking_id": booking_id}),
+            settings,
+        )
     except Exception:
         # Log the error but continue
         pass
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    settings = get_settings()
-    uvicorn.run(
-        "airline_saga.orchestrator.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-    )
+    from airline_saga.common.uvicorn_config import run_service
+
+    run_service("airline_saga.orchestrator.main:app", get_settings())
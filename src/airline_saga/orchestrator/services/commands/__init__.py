@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+
+import httpx
+
 from airline_saga.orchestrator.models import PaymentDetails, BookingDetails
 from airline_saga.common.config import OrchestratorSettings
 
 
 class OrchestratorCommand(ABC):
+    # Commands are built for every saga, so none of them carry an instance dict
+    __slots__ = ()
+
     @abstractmethod
     async def execute(self):
         raise NotImplementedError(
@@ -18,7 +24,7 @@ class OrchestratorCommand(ABC):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrchestratorCommandArgs:
     booking: BookingDetails
     passenger_name: str
@@ -26,3 +32,4 @@ class OrchestratorCommandArgs:
     seat_number: str
     payment_details: PaymentDetails
     settings: OrchestratorSettings
+    http_client: httpx.AsyncClient
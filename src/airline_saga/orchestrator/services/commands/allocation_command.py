@@ -1,10 +1,11 @@
-import httpx
-from airline_saga.common.models import TransactionResult, BookingStep
+import orjson
+from airline_saga.common.models import BookingStep
 from airline_saga.common.exceptions import OrchestratorException
 from airline_saga.orchestrator.services.commands import (
     OrchestratorCommand,
     OrchestratorCommandArgs,
 )
+from airline_saga.orchestrator.services.http import parse_result, post_json
 from airline_saga.orchestrator import logger
 
 
@@ -15,6 +16,15 @@ class AllocateCommand(OrchestratorCommand):
     It can allocate a seat for a booking and undo the allocation if needed.
     """
 
+    __slots__ = (
+        "booking",
+        "flight_number",
+        "http_client",
+        "passenger_name",
+        "seat_number",
+        "settings",
+    )
+
     def __init__(
         self,
         command_args: OrchestratorCommandArgs,
@@ -28,6 +38,7 @@ class AllocateCommand(OrchestratorCommand):
                 - seat_number: Seat number to allocate
                 - passenger_name: Name of the passenger
                 - settings: Application settings
+                - http_client: Shared HTTP client for the downstream calls
         """
         super().__init__()
         self.booking = command_args.booking
@@ -35,6 +46,7 @@ class AllocateCommand(OrchestratorCommand):
         self.seat_number = command_args.seat_number
         self.passenger_name = command_args.passenger_name
         self.settings = command_args.settings
+        self.http_client = command_args.http_client
 
     async def execute(self):
         """Execute the seat allocation.
@@ -46,40 +58,47 @@ class AllocateCommand(OrchestratorCommand):
             OrchestratorException: If the allocation service fails to process the request
         """
         booking_id = self.booking.booking_id
-        async with httpx.AsyncClient() as client:
-            logger.info(f"Allocating seat for booking '{booking_id}'")
-            allocation_response = await client.post(
-                f"{self.settings.allocation_service_url}/api/allocations/allocate",
-                json={
+        logger.debug("Allocating seat for booking '%s'", booking_id)
+        allocation_response = await post_json(
+            self.http_client,
+            self.settings.urls.allocation_allocate,
+            orjson.dumps(
+                {
                     "booking_id": booking_id,
                     "flight_number": self.flight_number,
                     "seat_number": self.seat_number,
                     "passenger_name": self.passenger_name,
-                },
+                }
+            ),
+            self.settings,
+        )
+        if allocation_response.status_code != 200:
+            error_data = orjson.loads(allocation_response.content)
+            logger.error(
+                f"Allocation service failed to process allocation: {error_data}"
+            )
+            raise OrchestratorException(
+                f"Failed to allocate seat: {error_data.get('message', 'Unknown error')}",
+                booking_id=booking_id,
             )
-            if allocation_response.status_code != 200:
-                error_data = allocation_response.json()
-                logger.error(
-                    f"Allocation service failed to process allocation: {error_data}"
-                )
-                raise OrchestratorException(
-                    f"Failed to allocate seat: {error_data.get('message', 'Unknown error')}",
-                    booking_id=booking_id,
-                )
 
-            allocation_result = TransactionResult(**allocation_response.json())
-            self.booking.steps.append(
-                BookingStep(
-                    service="allocation_service",
-                    operation="allocate_seat",
-                    status=allocation_result.status,
-                    timestamp=allocation_result.data.get("timestamp", ""),
-                )
+        allocation_result = parse_result(allocation_response, self.settings)
+        self.booking.steps.append(
+            BookingStep(
+                service="allocation_service",
+                operation="allocate_seat",
+                status=allocation_result.status,
+                timestamp=allocation_result.data.get("timestamp", ""),
             )
-            # Store boarding pass
-            if allocation_result.data and "boarding_pass" in allocation_result.data:
-                self.booking.boarding_pass = allocation_result.data["boarding_pass"]
-            logger.info(f"Seat allocated successfully for booking '{booking_id}'")
+        )
+        # Store boarding pass
+        if allocation_result.data and "boarding_pass" in allocation_result.data:
+            self.booking.boarding_pass = allocation_result.data["boarding_pass"]
+        logger.info(
+            "Seat allocated for booking '%s'",
+            booking_id,
+            extra={"booking_id": booking_id, "stage": "seat_allocated"},
+        )
 
     async def undo(self):
         """Undo the seat allocation.
@@ -91,27 +110,26 @@ class AllocateCommand(OrchestratorCommand):
             Exception: If there is an error during cancellation
         """
         try:
-            async with httpx.AsyncClient() as client:
-                logger.info(
-                    f"Cancelling seat allocation for booking: {self.booking.booking_id}"
-                )
-                response = await client.post(
-                    f"{self.settings.payment_service_url}/api/allocations/cancel",
-                    json={"booking_id": self.booking.booking_id},
-                )
+            logger.info(
+                f"Cancelling seat allocation for booking: {self.booking.booking_id}"
+            )
+            response = await post_json(
+                self.http_client,
+                self.settings.urls.allocation_cancel,
+                orjson.dumps({"booking_id": self.booking.booking_id}),
+                self.settings,
+            )
 
-                cancel_result = TransactionResult(**response.json())
-                logger.info(
-                    f"Cancel seat allocation transaction result: {cancel_result}"
-                )
-                self.booking.steps.append(
-                    BookingStep(
-                        service="allocation_service",
-                        operation="cancel_seat_allocation",
-                        status=response.status,
-                        timestamp=response.data.get("timestamp", ""),
-                    )
+            cancel_result = parse_result(response, self.settings)
+            logger.info(f"Cancel seat allocation transaction result: {cancel_result}")
+            self.booking.steps.append(
+                BookingStep(
+                    service="allocation_service",
+                    operation="cancel_seat_allocation",
+                    status=cancel_result.status,
+                    timestamp=(cancel_result.data or {}).get("timestamp", ""),
                 )
+            )
         except Exception as e:
             logger.error(f"Error while cancelling the allocation: {str(e)}")
             raise
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple, Type, Union
 from enum import Enum
 from airline_saga.orchestrator.services.commands import (
     OrchestratorCommand,
@@ -7,6 +7,9 @@ from airline_saga.orchestrator.services.commands import (
 from airline_saga.orchestrator.services.commands.allocation_command import (
     AllocateCommand,
 )
+from airline_saga.orchestrator.services.commands.command_group import (
+    OrchestratorCommandGroup,
+)
 from airline_saga.orchestrator.services.commands.payment_command import PaymentCommand
 from airline_saga.orchestrator.services.commands.seat_command import SeatCommand
 from airline_saga.orchestrator import logger
@@ -17,16 +20,35 @@ class OrchestratorCommandType(Enum):
     ALLOCATION = "ALLOCATION"
     PAYMENT = "PAYMENT"
     SEAT = "SEAT"
+    PARALLEL_SEAT_ALLOCATION = "PARALLEL_SEAT_ALLOCATION"
+
 
+# A command class, or a tuple of independent command classes run concurrently
+CommandSpec = Union[Type[OrchestratorCommand], Tuple[Type[OrchestratorCommand], ...]]
 
 # Registry mapping command types to their implementing classes
-ORCHESTRATOR_COMMAND_REGISTRY = {
+ORCHESTRATOR_COMMAND_REGISTRY: Dict[OrchestratorCommandType, CommandSpec] = {
     OrchestratorCommandType.ALLOCATION: AllocateCommand,
     OrchestratorCommandType.PAYMENT: PaymentCommand,
     OrchestratorCommandType.SEAT: SeatCommand,
+    OrchestratorCommandType.PARALLEL_SEAT_ALLOCATION: (SeatCommand, AllocateCommand),
 }
 
 
+def _index_by_name(
+    command_registry: Dict[OrchestratorCommandType, CommandSpec],
+) -> Dict[str, CommandSpec]:
+    """Key a command registry by command name instead of command type."""
+    return {
+        command_type.value: command_spec
+        for command_type, command_spec in command_registry.items()
+    }
+
+
+# Default registry keyed by command name, so lookups are a single dict probe
+_COMMANDS_BY_NAME = _index_by_name(ORCHESTRATOR_COMMAND_REGISTRY)
+
+
 class OrchestratorCommandFactory:
     """
     Factory class for creating orchestrator command instances.
@@ -37,7 +59,7 @@ class OrchestratorCommandFactory:
         self,
         command_args: OrchestratorCommandArgs,
         command_registry: Dict[
-            OrchestratorCommandType, OrchestratorCommand
+            OrchestratorCommandType, CommandSpec
         ] = ORCHESTRATOR_COMMAND_REGISTRY,
     ):
         """
@@ -45,9 +67,14 @@ class OrchestratorCommandFactory:
 
         Args:
             command_args: Arguments required to instantiate commands
-            command_registry: Registry mapping command types to command classes
+            command_registry: Registry mapping command types to command classes,
+                or to tuples of command classes to run as a group
         """
-        self._registry = command_registry
+        self._registry = (
+            _COMMANDS_BY_NAME
+            if command_registry is ORCHESTRATOR_COMMAND_REGISTRY
+            else _index_by_name(command_registry)
+        )
         self._command_args = command_args
 
     def get_command(
@@ -61,19 +88,24 @@ class OrchestratorCommandFactory:
             command_name: Name of the command to instantiate
 
         Returns:
-            An instance of the requested command
+            An instance of the requested command, or a command group for
+            grouped command types
 
         Raises:
             ValueError: If command name is invalid or not found in registry
         """
-        try:
-            command_type = OrchestratorCommandType(command_name)
-        except ValueError as e:
-            logger.exception(f"Invalid command name: {command_name}. Error: {e}")
-            raise ValueError(f"Command '{command_name}' is not supported")
-
-        command_class = self._registry.get(command_type, None)
-        if not command_class:
+        command_class = self._registry.get(command_name)
+        if command_class is None:
+            try:
+                OrchestratorCommandType(command_name)
+            except ValueError:
+                logger.error(f"Invalid command name: {command_name}")
+                raise ValueError(f"Command '{command_name}' is not supported") from None
             raise ValueError(f"No command found for type: {command_name}")
 
+        if isinstance(command_class, tuple):
+            return OrchestratorCommandGroup(
+                [grouped_class(self._command_args) for grouped_class in command_class]
+            )
+
         return command_class(self._command_args)
@@ -0,0 +1,90 @@
+import asyncio
+from typing import List
+
+from airline_saga.orchestrator import logger
+from airline_saga.orchestrator.services.commands import OrchestratorCommand
+
+
+class OrchestratorCommandGroup(OrchestratorCommand):
+    """
+    Command running independent commands concurrently as a single saga step.
+    The commands must not depend on each other's results.
+    """
+
+    __slots__ = ("commands",)
+
+    def __init__(self, commands: List[OrchestratorCommand]):
+        """
+        Initialize the OrchestratorCommandGroup.
+
+        Args:
+            commands: The independent commands to run together
+        """
+        super().__init__()
+        self.commands = commands
+
+    async def execute(self):
+        """
+        Execute all the commands concurrently.
+
+        If any command fails, the ones that succeeded are undone before the
+        error is raised, so a failed group leaves nothing to compensate.
+
+        Raises:
+            Exception: The first error raised by a command
+        """
+        results = await asyncio.gather(
+            *(command.execute() for command in self.commands),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if not errors:
+            return
+
+        logger.error(f"{len(errors)} of {len(self.commands)} grouped commands failed")
+        # Roll back the commands that succeeded; a failing undo is logged but
+        # the execute error is what the caller sees
+        await self._undo_all(
+            [
+                command
+                for command, result in zip(self.commands, results, strict=True)
+                if not isinstance(result, BaseException)
+            ],
+        )
+        raise errors[0]
+
+    async def undo(self):
+        """
+        Undo all the commands concurrently.
+
+        Every undo runs even if another one fails, so a single failure does
+        not leave the rest of the group uncompensated.
+
+        Raises:
+            Exception: The first error raised by an undo
+        """
+        errors = await self._undo_all(self.commands)
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    async def _undo_all(commands: List[OrchestratorCommand]) -> List[BaseException]:
+        """
+        Undo the commands concurrently, letting every undo run.
+
+        Args:
+            commands: The commands to undo
+
+        Returns:
+            The errors raised by the undos, each one already logged
+        """
+        results = await asyncio.gather(
+            *(command.undo() for command in commands),
+            return_exceptions=True,
+        )
+        errors = []
+        for command, result in zip(commands, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Undo of {type(command).__name__} failed: {result!r}")
+                errors.append(result)
+        return errors
@@ -1,10 +1,14 @@
-import httpx
-from airline_saga.common.models import TransactionResult, BookingStep
+import orjson
+from airline_saga.common.models import (
+    TransactionStatus,
+    BookingStep,
+)
 from airline_saga.common.exceptions import OrchestratorException
 from airline_saga.orchestrator.services.commands import (
     OrchestratorCommand,
     OrchestratorCommandArgs,
 )
+from airline_saga.orchestrator.services.http import parse_result, post_json
 from airline_saga.orchestrator import logger
 
 
@@ -14,6 +18,15 @@ class PaymentCommand(OrchestratorCommand):
     Inherits from OrchestratorCommand base class.
     """
 
+    __slots__ = (
+        "booking",
+        "flight_number",
+        "http_client",
+        "payment_details",
+        "seat_number",
+        "settings",
+    )
+
     def __init__(
         self,
         command_args: OrchestratorCommandArgs,
@@ -35,6 +48,7 @@ class PaymentCommand(OrchestratorCommand):
         self.seat_number = command_args.seat_number
         self.payment_details = command_args.payment_details
         self.settings = command_args.settings
+        self.http_client = command_args.http_client
 
     async def execute(self):
         """
@@ -47,48 +61,55 @@ class PaymentCommand(OrchestratorCommand):
             OrchestratorException: If payment processing fails
         """
         booking_id = self.booking.booking_id
-        async with httpx.AsyncClient() as client:
-            logger.info(f"Processing payment for booking {booking_id}")
+        logger.debug("Processing payment for booking '%s'", booking_id)
 
-            payment_response = await client.post(
-                f"{self.settings.payment_service_url}/api/payments/process",
-                json={
+        payment_response = await post_json(
+            self.http_client,
+            self.settings.urls.payment_process,
+            orjson.dumps(
+                {
                     "booking_id": self.booking.booking_id,
                     "amount": self.payment_details.amount,
                     "currency": self.payment_details.currency,
                     "payment_method_type": self.payment_details.payment_method_type,
                     "payment_metadata": self.payment_details.payment_metadata,
-                },
-            )
+                }
+            ),
+            self.settings,
+        )
 
-            if payment_response.status_code != 200:
-                logger.error("Payment service failed to process payment")
-                error_data = payment_response.json()
-                error_msg = error_data.get("message", "Unknown error")
-
-                self.booking.steps.append(
-                    BookingStep(
-                        service="payment_service",
-                        operation="process_payment",
-                        status="FAILED",
-                        timestamp="",
-                        message=error_msg,
-                    )
-                )
-                raise OrchestratorException(
-                    f"Failed to process payment: {error_msg}", booking_id=booking_id
-                )
+        if payment_response.status_code != 200:
+            logger.error("Payment service failed to process payment")
+            error_data = orjson.loads(payment_response.content)
+            error_msg = error_data.get("message", "Unknown error")
 
-            payment_result = TransactionResult(**payment_response.json())
             self.booking.steps.append(
                 BookingStep(
                     service="payment_service",
                     operation="process_payment",
-                    status=payment_result.status,
-                    timestamp=payment_result.data.get("timestamp", ""),
+                    status=TransactionStatus.FAILED,
+                    timestamp="",
+                    message=error_msg,
                 )
             )
-            logger.info("Payment processed successfully")
+            raise OrchestratorException(
+                f"Failed to process payment: {error_msg}", booking_id=booking_id
+            )
+
+        payment_result = parse_result(payment_response, self.settings)
+        self.booking.steps.append(
+            BookingStep(
+                service="payment_service",
+                operation="process_payment",
+                status=payment_result.status,
+                timestamp=payment_result.data.get("timestamp", ""),
+            )
+        )
+        logger.info(
+            "Payment processed for booking '%s'",
+            booking_id,
+            extra={"booking_id": booking_id, "stage": "payment_processed"},
+        )
 
     async def undo(self):
         """
@@ -102,23 +123,24 @@ class PaymentCommand(OrchestratorCommand):
         """
         booking_id = self.booking.booking_id
         try:
-            async with httpx.AsyncClient() as client:
-                logger.info(f"Refunding payment for booking '{booking_id}")
-                response = await client.post(
-                    f"{self.settings.payment_service_url}/api/payments/refund",
-                    json={"booking_id": booking_id},
-                )
+            logger.info(f"Refunding payment for booking '{booking_id}")
+            response = await post_json(
+                self.http_client,
+                self.settings.urls.payment_refund,
+                orjson.dumps({"booking_id": booking_id}),
+                self.settings,
+            )
 
-                refund_result = TransactionResult(**response.json())
-                logger.info(f"Payment refund transaction result: {refund_result}")
-                self.booking.steps.append(
-                    BookingStep(
-                        service="payment_service",
-                        operation="refund_payment",
-                        status=response.status,
-                        timestamp=response.data.get("timestamp", ""),
-                    )
+            refund_result = parse_result(response, self.settings)
+            logger.info(f"Payment refund transaction result: {refund_result}")
+            self.booking.steps.append(
+                BookingStep(
+                    service="payment_service",
+                    operation="refund_payment",
+                    status=refund_result.status,
+                    timestamp=refund_result.data.get("timestamp", ""),
                 )
+            )
         except Exception as e:
             logger.error(f"Error while refunding payment '{booking_id}': {str(e)}")
             raise
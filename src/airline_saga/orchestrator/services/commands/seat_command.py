@@ -1,10 +1,14 @@
-import httpx
-from airline_saga.common.models import TransactionResult, BookingStep
+import orjson
+from airline_saga.common.models import (
+    TransactionStatus,
+    BookingStep,
+)
 from airline_saga.common.exceptions import OrchestratorException
 from airline_saga.orchestrator.services.commands import (
     OrchestratorCommand,
     OrchestratorCommandArgs,
 )
+from airline_saga.orchestrator.services.http import parse_result, post_json
 from airline_saga.orchestrator import logger
 
 
@@ -14,6 +18,14 @@ class SeatCommand(OrchestratorCommand):
     Handles blocking and releasing seats as part of the booking saga pattern.
     """
 
+    __slots__ = (
+        "booking",
+        "flight_number",
+        "http_client",
+        "seat_number",
+        "settings",
+    )
+
     def __init__(
         self,
         command_args: OrchestratorCommandArgs,
@@ -27,12 +39,14 @@ class SeatCommand(OrchestratorCommand):
                 - flight_number: Flight number for the allocation
                 - seat_number: Seat number to allocate
                 - settings: Application settings
+                - http_client: Shared HTTP client for the downstream calls
         """
         super().__init__()
         self.booking = command_args.booking
         self.flight_number = command_args.flight_number
         self.seat_number = command_args.seat_number
         self.settings = command_args.settings
+        self.http_client = command_args.http_client
 
     async def execute(self):
         """
@@ -45,45 +59,52 @@ class SeatCommand(OrchestratorCommand):
             OrchestratorException: If the seat blocking operation fails
         """
         # Step 1: Block seat
-        async with httpx.AsyncClient() as client:
-            logger.info("Invoking Seat service: block seat")
-            block_response = await client.post(
-                f"{self.settings.seat_service_url}/api/seats/block",
-                json={
+        logger.debug("Blocking seat for booking '%s'", self.booking.booking_id)
+        block_response = await post_json(
+            self.http_client,
+            self.settings.urls.seat_block,
+            orjson.dumps(
+                {
                     "booking_id": self.booking.booking_id,
                     "flight_number": self.flight_number,
                     "seat_number": self.seat_number,
-                },
-            )
-
-            if block_response.status_code != 200:
-                error_data = block_response.json()
-                logger.error(f"Cannot block seat: {error_data}")
-                error_msg = error_data.get("message", "Unknown error")
-                self.booking.steps.append(
-                    BookingStep(
-                        service="seat_service",
-                        operation="block_seat",
-                        status="FAILED",
-                        timestamp="",
-                        message=error_msg,
-                    )
-                )
-                raise OrchestratorException(
-                    f"Failed to block seat: {error_data.get('message', 'Unknown error')}",
-                    booking_id=self.booking.booking_id,
-                )
+                }
+            ),
+            self.settings,
+        )
 
-            logger.info("Seat blocked successfully")
-            block_result = TransactionResult(**block_response.json())
+        if block_response.status_code != 200:
+            error_data = orjson.loads(block_response.content)
+            logger.error(f"Cannot block seat: {error_data}")
+            error_msg = error_data.get("message", "Unknown error")
             self.booking.steps.append(
                 BookingStep(
                     service="seat_service",
                     operation="block_seat",
-                    status=block_result.status,
-                    timestamp=block_result.data.get("timestamp", ""),
+                    status=TransactionStatus.FAILED,
+                    timestamp="",
+                    message=error_msg,
                 )
             )
+            raise OrchestratorException(
+                f"Failed to block seat: {error_data.get('message', 'Unknown error')}",
+                booking_id=self.booking.booking_id,
+            )
+
+        block_result = parse_result(block_response, self.settings)
+        self.booking.steps.append(
+            BookingStep(
+                service="seat_service",
+                operation="block_seat",
+                status=block_result.status,
+                timestamp=block_result.data.get("timestamp", ""),
+            )
+        )
+        logger.info(
+            "Seat blocked for booking '%s'",
+            self.booking.booking_id,
+            extra={"booking_id": self.booking.booking_id, "stage": "seat_blocked"},
+        )
 
     async def undo(self):
         """
@@ -97,21 +118,22 @@ class SeatCommand(OrchestratorCommand):
         """
         logger.info(f"Releasing the seat for booking: {self.booking.booking_id}")
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.settings.seat_service_url}/api/seats/release",
-                    json={"booking_id": self.booking.booking_id},
-                )
-                release_seat_result = TransactionResult(**response.json())
-                logger.info(f"Release seat transaction result: {release_seat_result}")
-                self.booking.steps.append(
-                    BookingStep(
-                        service="seat_service",
-                        operation="release_seat",
-                        status=release_seat_result.status,
-                        timestamp=release_seat_result.data.get("timestamp", ""),
-                    )
+            response = await post_json(
+                self.http_client,
+                self.settings.urls.seat_release,
+                orjson.dumps({"booking_id": self.booking.booking_id}),
+                self.settings,
+            )
+            release_seat_result = parse_result(response, self.settings)
+            logger.info(f"Release seat transaction result: {release_seat_result}")
+            self.booking.steps.append(
+                BookingStep(
+                    service="seat_service",
+                    operation="release_seat",
+                    status=release_seat_result.status,
+                    timestamp=release_seat_result.data.get("timestamp", ""),
                 )
+            )
         except Exception as e:
             logger.error(f"Error while releasing the seat: {str(e)}")
             raise
@@ -0,0 +1,96 @@
+"""HTTP helpers for the orchestrator's calls to the downstream services."""
+
+import asyncio
+
+import httpx
+import orjson
+
+from airline_saga.common.config import OrchestratorSettings
+from airline_saga.common.models import TransactionResult
+from airline_saga.orchestrator import logger
+
+# Headers for request bodies encoded with orjson and sent as raw content
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Failures that happen before the request reaches the service, so retrying
+# cannot apply a saga step twice
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def downstream_timeout(settings: OrchestratorSettings) -> httpx.Timeout:
+    """
+    Build the timeout the shared client applies to every downstream call.
+
+    Args:
+        settings: The service settings
+
+    Returns:
+        The httpx timeout configuration
+    """
+    return httpx.Timeout(
+        connect=settings.http_connect_timeout,
+        read=settings.http_read_timeout,
+        write=settings.http_write_timeout,
+        pool=settings.http_pool_timeout,
+    )
+
+
+async def post_json(
+    client: httpx.AsyncClient,
+    url: str,
+    content: bytes,
+    settings: OrchestratorSettings,
+) -> httpx.Response:
+    """
+    POST a pre-encoded JSON body, retrying with backoff on connection errors.
+
+    Args:
+        client: The HTTP client, configured with downstream_timeout
+        url: The downstream endpoint
+        content: The JSON-encoded request body
+        settings: The service settings
+
+    Returns:
+        The downstream response
+
+    Raises:
+        httpx.HTTPError: If the call times out, or cannot connect after the
+            configured number of attempts
+        TimeoutError: If an attempt exceeds the overall call deadline
+    """
+    attempts = settings.http_retry_attempts
+    for attempt in range(attempts):
+        try:
+            # Overall deadline on top of the client's per-operation timeouts,
+            # which a response trickling in chunk by chunk would never trip
+            async with asyncio.timeout(settings.http_call_timeout):
+                return await client.post(url, content=content, headers=JSON_HEADERS)
+        except RETRYABLE_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = settings.http_retry_backoff * 2**attempt
+            logger.warning(f"Call to {url} failed ({e!r}), retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+
+def parse_result(
+    response: httpx.Response,
+    settings: OrchestratorSettings,
+) -> TransactionResult:
+    """
+    Parse a successful downstream response into a transaction result.
+
+    The body is decoded with orjson straight from the response bytes. When
+    the services are trusted the result is built without validation,
+    otherwise the body is validated against the model.
+
+    Args:
+        response: The downstream response
+        settings: The service settings
+
+    Returns:
+        The transaction result
+    """
+    if settings.trust_internal_services:
+        return TransactionResult.from_trusted(orjson.loads(response.content))
+    return TransactionResult.model_validate_json(response.content)
@@ -1,7 +1,8 @@
 """Payment Service API implementation."""
 
+from functools import lru_cache
 from typing import Dict
-import uuid
+import secrets
 from fastapi import FastAPI
 
 from airline_saga.common.models import (
@@ -10,6 +11,7 @@ from airline_saga.common.models import (
     PaymentStatus,
 )
 from airline_saga.common.config import PaymentServiceSettings
+from airline_saga.common.responses import ORJSONResponse
 from airline_saga.common.exceptions import (
     PaymentFailedException,
     RefundFailedException,
@@ -23,17 +25,19 @@ from airline_saga.payment_service.models import (
 from airline_saga.payment_service.exception_handlers import register_exception_handlers
 
 app: FastAPI = FastAPI(
-    title="Payment Service", description="Service for processing payments"
+    title="Payment Service",
+    description="Service for processing payments",
+    default_response_class=ORJSONResponse,
 )
 
 # Register exception handlers
 register_exception_handlers(app)
 
-# In-memory database for simplicity
-payments_db: Dict[str, Payment] = {}
-payment_by_booking_id: Dict[str, str] = {}  # booking_id -> payment_id
+# In-memory database for simplicity, keyed by booking ID
+booking_to_payment: Dict[str, Payment] = {}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> PaymentServiceSettings:
     """Get service settings."""
     return PaymentServiceSettings()
@@ -58,27 +62,26 @@ async def process_payment(request: ProcessPaymentRequest):
     """
     booking_id = request.booking_id
 
-    # Check if payment already exists for this booking
-    if booking_id in payment_by_booking_id:
-        existing_payment_id = payment_by_booking_id[booking_id]
-        existing_payment = payments_db[existing_payment_id]
-
-        # If payment is already completed, return success
-        if existing_payment.status == PaymentStatus.COMPLETED:
-            return TransactionResult(
-                success=True,
-                booking_id=booking_id,
-                status=TransactionStatus.COMPLETED,
-                message="Payment already processed",
-                data={
-                    "payment_id": existing_payment_id,
-                    "amount": existing_payment.amount,
-                    "currency": existing_payment.currency,
-                },
-            )
+    # If a payment already exists for this booking and is completed, return success
+    existing_payment = booking_to_payment.get(booking_id)
+    if (
+        existing_payment is not None
+        and existing_payment.status == PaymentStatus.COMPLETED
+    ):
+        return TransactionResult(
+            success=True,
+            booking_id=booking_id,
+            status=TransactionStatus.COMPLETED,
+            message="Payment already processed",
+            data={
+                "payment_id": existing_payment.payment_id,
+                "amount": existing_payment.amount,
+                "currency": existing_payment.currency,
+            },
+        )
 
     # Generate a payment ID
-    payment_id = f"pay_{str(uuid.uuid4())[:8]}"
+    payment_id = f"pay_{secrets.token_hex(4)}"
 
     # Simulate payment processing
     # In a real implementation, this would call a payment gateway
@@ -101,8 +104,7 @@ async def process_payment(request: ProcessPaymentRequest):
     )
 
     # Store payment
-    payments_db[payment_id] = payment
-    payment_by_booking_id[booking_id] = payment_id
+    booking_to_payment[booking_id] = payment
 
     return TransactionResult(
         success=True,
@@ -131,13 +133,13 @@ async def refund_payment(request: RefundPaymentRequest):
     booking_id = request.booking_id
 
     # Check if payment exists for this booking
-    if booking_id not in payment_by_booking_id:
+    payment = booking_to_payment.get(booking_id)
+    if payment is None:
         raise BookingNotFoundException(
             f"No payment found for booking {booking_id}", booking_id=booking_id
         )
 
-    payment_id = payment_by_booking_id[booking_id]
-    payment = payments_db[payment_id]
+    payment_id = payment.payment_id
 
     # Check if payment can be refunded
     if payment.status == PaymentStatus.REFUNDED:
@@ -163,7 +165,6 @@ async def refund_payment(request: RefundPaymentRequest):
 
     # Update payment status
     payment.status = PaymentStatus.REFUNDED
-    payments_db[payment_id] = payment
 
     # Generate a refund ID
     refund_id = f"ref_{payment_id[4:]}"
@@ -178,12 +179,6 @@ async def refund_payment(request: RefundPaymentRequest):
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    settings = get_settings()
-    uvicorn.run(
-        "airline_saga.payment_service.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-    )
+    from airline_saga.common.uvicorn_config import run_service
+
+    run_service("airline_saga.payment_service.main:app", get_settings())
@@ -1,8 +1,9 @@
 """Models specific to the payment service."""
 
+from dataclasses import dataclass
 from typing import Dict, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from airline_saga.common.models import PaymentMethodType, PaymentStatus
 
@@ -10,6 +11,8 @@ from airline_saga.common.models import PaymentMethodType, PaymentStatus
 class ProcessPaymentRequest(BaseModel):
     """Request to process a payment."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     booking_id: str
     amount: float
     currency: str
@@ -20,11 +23,16 @@ class ProcessPaymentRequest(BaseModel):
 class RefundPaymentRequest(BaseModel):
     """Request to refund a payment."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     booking_id: str
 
 
-class Payment(BaseModel):
-    """Model representing a payment."""
+# Payments are only kept in the service's store and never cross the API
+# boundary, so they are a slotted dataclass rather than a validated model
+@dataclass(slots=True)
+class Payment:
+    """A payment record held by the payment service."""
 
     payment_id: str
     booking_id: str
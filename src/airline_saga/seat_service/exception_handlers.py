@@ -1,9 +1,8 @@
 """Exception handlers for the seat service."""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 
-from airline_saga.common.models import TransactionStatus
+from airline_saga.common.responses import error_response
 from airline_saga.common.exceptions import (
     SagaException,
     FlightNotFoundException,
@@ -12,67 +11,33 @@ from airline_saga.common.exceptions import (
 )
 
 
-async def saga_exception_handler(_: Request, exc: SagaException):
-    """Generic handler for all saga exceptions."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+def _make_handler(status_code: int):
+    """
+    Build an exception handler returning the saga error body.
 
+    Args:
+        status_code: HTTP status code of the error response
 
-async def flight_not_found_exception_handler(_: Request, exc: FlightNotFoundException):
-    """Handler for flight not found exceptions."""
-    return JSONResponse(
-        status_code=404,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+    Returns:
+        The exception handler
+    """
 
+    async def handler(_: Request, exc: SagaException):
+        return error_response(status_code, exc)
 
-async def seat_not_found_exception_handler(_: Request, exc: SeatNotFoundException):
-    """Handler for seat not found exceptions."""
-    return JSONResponse(
-        status_code=404,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+    return handler
 
 
-async def seat_not_available_exception_handler(
-    _: Request, exc: SeatNotAvailableException
-):
-    """Handler for seat not available exceptions."""
-    return JSONResponse(
-        status_code=409,
-        content={
-            "success": False,
-            "booking_id": exc.booking_id,
-            "status": TransactionStatus.FAILED,
-            "message": str(exc),
-        },
-    )
+# Handlers in registration order, from the generic base to the specific exceptions
+_EXCEPTION_HANDLERS = (
+    (SagaException, _make_handler(500)),
+    (FlightNotFoundException, _make_handler(404)),
+    (SeatNotFoundException, _make_handler(404)),
+    (SeatNotAvailableException, _make_handler(409)),
+)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers for the seat service."""
-    app.add_exception_handler(SagaException, saga_exception_handler)
-    app.add_exception_handler(
-        FlightNotFoundException, flight_not_found_exception_handler
-    )
-    app.add_exception_handler(SeatNotFoundException, seat_not_found_exception_handler)
-    app.add_exception_handler(
-        SeatNotAvailableException, seat_not_available_exception_handler
-    )
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
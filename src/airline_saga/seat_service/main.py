@@ -1,18 +1,26 @@
 """Seat Service API implementation."""
 
 from typing import Dict, Optional
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Response
 from contextlib import asynccontextmanager
 
-from airline_saga.common.models import TransactionStatus, TransactionResult
+from airline_saga.common.models import (
+    STATUS_COMPLETED,
+    STATUS_RELEASED,
+    TransactionResult,
+    TransactionResultPayload,
+)
 from airline_saga.common.config import SeatServiceSettings
+from airline_saga.common.responses import ORJSONResponse
 from airline_saga.common.exceptions import (
     FlightNotFoundException,
     SeatNotFoundException,
     SeatNotAvailableException,
 )
 from airline_saga.seat_service.models import (
+    BlockedSeatRef,
     Flight,
+    Seat,
     BlockSeatRequest,
     ReleaseSeatRequest,
     SeatStatus,
@@ -22,7 +30,7 @@ from airline_saga.seat_service.utils import init_flights_db
 
 # In-memory database for simplicity
 # flights_db: Dict[str, Flight] = {}
-blocked_seats: Dict[str, Dict] = {}  # booking_id -> {flight_number, seat_number}
+blocked_seats: Dict[str, BlockedSeatRef] = {}  # booking_id -> blocked seat
 
 
 @asynccontextmanager
@@ -30,7 +38,7 @@ async def setup_teardown_lifespan(app: FastAPI):
     global flights_db
     flights_db = init_flights_db()
     # Track blocked seats
-    blocked_seats["demo-booking-1"] = {"flight_number": "FL001", "seat_number": "1B"}
+    blocked_seats["demo-booking-1"] = BlockedSeatRef("FL001", "1B")
 
     yield
 
@@ -39,6 +47,7 @@ app = FastAPI(
     title="Seat Service",
     description="Service for managing flight seats",
     lifespan=setup_teardown_lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Register exception handlers
@@ -50,13 +59,18 @@ def get_settings() -> SeatServiceSettings:
     return SeatServiceSettings()
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse, response_model=None)
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
 
-@app.get("/api/flights/{flight_number}")
+@app.get(
+    "/api/flights/{flight_number}",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": Flight}},
+)
 async def get_flight(
     flight_number: str,
     status: Optional[SeatStatus] = Query(None, description="Filter seats by status"),
@@ -76,16 +90,16 @@ async def get_flight(
 
     flight = flights_db[flight_number]
 
-    # If status filter is provided, filter the seats
-    if status:
-        filtered_seats = [seat for seat in flight.seats if seat.status == status]
-        # Return a new Flight object with only the filtered seats
-        return Flight(flight_number=flight_number, seats=filtered_seats)
-
-    return flight
+    # Serve the flight, with only the seats of the status if one is given
+    return Response(flight.to_json(status), media_type="application/json")
 
 
-@app.get("/api/flights/{flight_number}/seats/{seat_number}")
+@app.get(
+    "/api/flights/{flight_number}/seats/{seat_number}",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": Seat}},
+)
 async def get_seat_of_flight(flight_number: str, seat_number: str):
     """
     Get flight information with optional seat status filtering.
@@ -102,16 +116,21 @@ async def get_seat_of_flight(flight_number: str, seat_number: str):
 
     flight = flights_db[flight_number]
 
-    seat = next((s for s in flight.seats if s.seat_number == seat_number), None)
+    seat = flight.get_seat(seat_number)
     if not seat:
         raise SeatNotFoundException(
             f"Seat {seat_number} not found in flight {flight_number}"
         )
 
-    return seat
+    return ORJSONResponse(seat)
 
 
-@app.post("/api/seats/block")
+@app.post(
+    "/api/seats/block",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": TransactionResult}},
+)
 async def block_seat(request: BlockSeatRequest):
     """
     Block a seat for a booking.
@@ -135,7 +154,7 @@ async def block_seat(request: BlockSeatRequest):
     flight = flights_db[flight_number]
 
     # Find the seat
-    seat = next((s for s in flight.seats if s.seat_number == seat_number), None)
+    seat = flight.get_seat(seat_number)
     if not seat:
         raise SeatNotFoundException(
             f"Seat {seat_number} not found on flight {flight_number}",
@@ -143,32 +162,37 @@ async def block_seat(request: BlockSeatRequest):
         )
 
     # Check if seat is available
-    if seat.status != SeatStatus.AVAILABLE:
+    if seat.status is not SeatStatus.AVAILABLE:
         raise SeatNotAvailableException(
             f"Seat {seat_number} on flight {flight_number} is not available",
             booking_id=booking_id,
         )
 
     # Block the seat
-    seat.status = SeatStatus.BLOCKED
-    seat.booking_id = booking_id
+    flight.set_seat_status(seat_number, SeatStatus.BLOCKED, booking_id)
 
     # Track the blocked seat
-    blocked_seats[booking_id] = {
-        "flight_number": flight_number,
-        "seat_number": seat_number,
-    }
-
-    return TransactionResult(
-        success=True,
-        booking_id=booking_id,
-        status=TransactionStatus.COMPLETED,
-        message=f"Seat {seat_number} on flight {flight_number} blocked successfully",
-        data={"flight_number": flight_number, "seat_number": seat_number},
+    blocked_seats[booking_id] = BlockedSeatRef(flight_number, seat_number)
+
+    return ORJSONResponse(
+        TransactionResultPayload(
+            success=True,
+            booking_id=booking_id,
+            status=STATUS_COMPLETED,
+            message=(
+                f"Seat {seat_number} on flight {flight_number} blocked successfully"
+            ),
+            data={"flight_number": flight_number, "seat_number": seat_number},
+        ).to_dict()
     )
 
 
-@app.post("/api/seats/release")
+@app.post(
+    "/api/seats/release",
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": TransactionResult}},
+)
 async def release_seat(request: ReleaseSeatRequest):
     """
     Release a blocked seat.
@@ -182,17 +206,18 @@ async def release_seat(request: ReleaseSeatRequest):
     booking_id = request.booking_id
 
     # Check if the booking has a blocked seat
-    if booking_id not in blocked_seats:
+    blocked_seat = blocked_seats.get(booking_id)
+    if blocked_seat is None:
         raise SeatNotFoundException(
             f"No blocked seat found for booking {booking_id}", booking_id=booking_id
         )
 
     # Get the flight and seat
-    flight_number = blocked_seats[booking_id]["flight_number"]
-    seat_number = blocked_seats[booking_id]["seat_number"]
+    flight_number = blocked_seat.flight_number
+    seat_number = blocked_seat.seat_number
 
     flight = flights_db[flight_number]
-    seat = next((s for s in flight.seats if s.seat_number == seat_number), None)
+    seat = flight.get_seat(seat_number)
 
     if not seat:
         raise SeatNotFoundException(
@@ -201,28 +226,25 @@ async def release_seat(request: ReleaseSeatRequest):
         )
 
     # Release the seat
-    seat.status = SeatStatus.AVAILABLE
-    seat.booking_id = None
+    flight.set_seat_status(seat_number, SeatStatus.AVAILABLE, None)
 
     # Remove from blocked seats
     del blocked_seats[booking_id]
 
-    return TransactionResult(
-        success=True,
-        booking_id=booking_id,
-        status=TransactionStatus.RELEASED,
-        message=f"Seat {seat_number} on flight {flight_number} released successfully",
-        data={"flight_number": flight_number, "seat_number": seat_number},
+    return ORJSONResponse(
+        TransactionResultPayload(
+            success=True,
+            booking_id=booking_id,
+            status=STATUS_RELEASED,
+            message=(
+                f"Seat {seat_number} on flight {flight_number} released successfully"
+            ),
+            data={"flight_number": flight_number, "seat_number": seat_number},
+        ).to_dict()
     )
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    settings = get_settings()
-    uvicorn.run(
-        "airline_saga.seat_service.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-    )
+    from airline_saga.common.uvicorn_config import run_service
+
+    run_service("airline_saga.seat_service.main:app", get_settings())
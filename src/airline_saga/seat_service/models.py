@@ -1,14 +1,21 @@
 """Models specific to the seat service."""
 
-from typing import Dict, Optional, List
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional, List
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from airline_saga.common.models import SeatStatus
 
 
-class Seat(BaseModel):
-    """Model representing a seat on a flight."""
+# Seats are the bulk of the in-memory store, so they are a slotted dataclass
+# rather than a model; Pydantic still validates them as part of a Flight, and
+# orjson encodes them natively. They are frozen so that a status change can
+# only go through Flight.set_seat_status, which keeps the encoded flight fresh
+@dataclass(slots=True, frozen=True)
+class Seat:
+    """A seat on a flight."""
 
     seat_number: str
     status: SeatStatus = SeatStatus.AVAILABLE
@@ -19,13 +26,101 @@ class Seat(BaseModel):
 class Flight(BaseModel):
     """Model representing a flight with its seats."""
 
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     flight_number: str
     seats: List[Seat]
 
+    # Position of each seat in the list, by seat number
+    _seat_positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    # Encoded flight, whole (None key) or filtered by seat status, served
+    # until set_seat_status changes a seat
+    _encoded: Dict[Optional[SeatStatus], bytes] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Build the seat index once the seats are validated."""
+        self._seat_positions = {
+            seat.seat_number: position for position, seat in enumerate(self.seats)
+        }
+
+    def get_seat(self, seat_number: str) -> Optional[Seat]:
+        """
+        Get a seat of the flight by its number.
+
+        Args:
+            seat_number: The seat number
+
+        Returns:
+            The seat, or None if the flight has no such seat
+        """
+        position = self._seat_positions.get(seat_number)
+        return None if position is None else self.seats[position]
+
+    def to_json(self, status: Optional[SeatStatus] = None) -> bytes:
+        """
+        Get the flight encoded as JSON, encoding it only after a change.
+
+        Args:
+            status: Optional seat status to keep only the seats with it, in
+                cabin order
+
+        Returns:
+            The JSON-encoded flight
+        """
+        encoded = self._encoded.get(status)
+        if encoded is None:
+            if status is None:
+                encoded = self.__pydantic_serializer__.to_json(self)
+            else:
+                encoded = orjson.dumps(
+                    {
+                        "flight_number": self.flight_number,
+                        "seats": [seat for seat in self.seats if seat.status is status],
+                    },
+                )
+            self._encoded[status] = encoded
+        return encoded
+
+    def set_seat_status(
+        self,
+        seat_number: str,
+        status: SeatStatus,
+        booking_id: Optional[str],
+    ) -> Seat:
+        """
+        Change the status of a seat of the flight, invalidating the encoded flight.
+
+        Args:
+            seat_number: The number of a seat of the flight
+            status: The new seat status
+            booking_id: The booking holding the seat, or None if released
+
+        Returns:
+            The updated seat
+        """
+        position = self._seat_positions[seat_number]
+        seat = replace(self.seats[position], status=status, booking_id=booking_id)
+        self.seats[position] = seat
+        self._encoded.clear()
+        return seat
+
+
+# Blocked seat references are only kept in the service's store, so they are a
+# slotted dataclass rather than a validated model
+@dataclass(slots=True, frozen=True)
+class BlockedSeatRef:
+    """Reference to the seat blocked for a booking."""
+
+    flight_number: str
+    seat_number: str
+
 
 class BlockSeatRequest(BaseModel):
     """Request to block a seat."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     booking_id: str
     flight_number: str
     seat_number: str
@@ -34,4 +129,6 @@ class BlockSeatRequest(BaseModel):
 class ReleaseSeatRequest(BaseModel):
     """Request to release a blocked seat."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     booking_id: str
@@ -1,39 +1,30 @@
 from typing import Dict
 from airline_saga.seat_service.models import Flight, SeatStatus, Seat
 
+# Seat layout shared by the sample flights
+_SAMPLE_SEAT_NUMBERS = ("1A", "1B", "1C", "2A", "2B", "2C")
+
+
+def _sample_flight(flight_number: str) -> Flight:
+    """Build a sample flight with every seat available."""
+    # The sample data is known to be valid, so the flight is built without
+    # validation; the seat index is still built by model_post_init
+    return Flight.model_construct(
+        flight_number=flight_number,
+        seats=[Seat(seat_number) for seat_number in _SAMPLE_SEAT_NUMBERS],
+    )
+
 
 def init_flights_db() -> Dict[str, Flight]:
-    flights_db = {}
     """Initialize the service with some sample data."""
     # Create sample flights
-    flights_db["FL001"] = Flight(
-        flight_number="FL001",
-        seats=[
-            Seat(seat_number="1A"),
-            Seat(seat_number="1B"),
-            Seat(seat_number="1C"),
-            Seat(seat_number="2A"),
-            Seat(seat_number="2B"),
-            Seat(seat_number="2C"),
-        ],
-    )
-
-    flights_db["FL002"] = Flight(
-        flight_number="FL002",
-        seats=[
-            Seat(seat_number="1A"),
-            Seat(seat_number="1B"),
-            Seat(seat_number="1C"),
-            Seat(seat_number="2A"),
-            Seat(seat_number="2B"),
-            Seat(seat_number="2C"),
-        ],
-    )
+    flights_db = {
+        flight_number: _sample_flight(flight_number)
+        for flight_number in ("FL001", "FL002")
+    }
 
     # Set some seats as blocked or booked for demonstration
     flight = flights_db["FL001"]
-    flight.seats[1].status = SeatStatus.BLOCKED
-    flight.seats[1].booking_id = "demo-booking-1"
-    flight.seats[2].status = SeatStatus.BOOKED
-    flight.seats[2].booking_id = "demo-booking-2"
+    flight.set_seat_status("1B", SeatStatus.BLOCKED, "demo-booking-1")
+    flight.set_seat_status("1C", SeatStatus.BOOKED, "demo-booking-2")
     return flights_db
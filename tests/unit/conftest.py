@@ -3,26 +3,16 @@
 import pytest
 from unittest.mock import MagicMock
 
-from airline_saga.orchestrator.models import BookingDetails, PaymentDetails
-from airline_saga.common.models import BookingStatus, PaymentMethodType
-from airline_saga.common.config import OrchestratorSettings
-from airline_saga.orchestrator.services.commands import OrchestratorCommandArgs
-
+import httpx
 
-@pytest.fixture
-def mock_booking_details():
-    """Create a mock BookingDetails instance."""
-    return BookingDetails(
-        booking_id="test-booking-id",
-        status=BookingStatus.PENDING,
-        passenger_name="John Doe",
-        flight_number="FL123",
-        seat_number="12A",
-        steps=[],
-    )
+from airline_saga.orchestrator.models import PaymentDetails
+from airline_saga.common.models import PaymentMethodType
+from airline_saga.common.config import OrchestratorSettings
 
 
-@pytest.fixture
+# Payment details and settings are only read by the tests, so one instance is
+# shared by the whole session; per-test state stays in function-scoped fixtures
+@pytest.fixture(scope="session")
 def mock_payment_details():
     """Create a mock PaymentDetails instance."""
     return PaymentDetails(
@@ -33,24 +23,38 @@ def mock_payment_details():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings():
     """Create a mock OrchestratorSettings instance."""
     settings = MagicMock(spec=OrchestratorSettings)
+    settings.commands = ["SEAT", "PAYMENT", "ALLOCATION"]
     settings.seat_service_url = "http://seat-service"
     settings.payment_service_url = "http://payment-service"
     settings.allocation_service_url = "http://allocation-service"
     return settings
 
 
-@pytest.fixture
-def command_args(mock_booking_details, mock_payment_details, mock_settings):
-    """Create a real OrchestratorCommandArgs instance with mock components."""
-    return OrchestratorCommandArgs(
-        booking=mock_booking_details,
-        passenger_name="John Doe",
-        flight_number="FL123",
-        seat_number="12A",
-        payment_details=mock_payment_details,
-        settings=mock_settings,
+@pytest.fixture(scope="session")
+def orchestrator_settings():
+    """Create real OrchestratorSettings for the command tests, with a tiny backoff."""
+    return OrchestratorSettings(
+        seat_service_url="http://seat-service",
+        payment_service_url="http://payment-service",
+        allocation_service_url="http://allocation-service",
+        http_retry_attempts=2,
+        http_retry_backoff=0.001,
+        trust_internal_services=True,
     )
+
+
+@pytest.fixture(scope="module")
+def mock_http_client():
+    """Create a mock HTTP client shared by the tests of a module."""
+    return MagicMock(spec=httpx.AsyncClient)
+
+
+@pytest.fixture
+def http_client(mock_http_client):
+    """Get the shared mock HTTP client, reset for the current test."""
+    mock_http_client.reset_mock(return_value=True, side_effect=True)
+    return mock_http_client
@@ -1,72 +1,73 @@
 """Tests for the AllocateCommand class."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import orjson
 
 from airline_saga.orchestrator.services.commands.allocation_command import (
     AllocateCommand,
 )
 from airline_saga.orchestrator.services.commands import OrchestratorCommandArgs
+from airline_saga.orchestrator.services.http import JSON_HEADERS
 from airline_saga.common.models import TransactionStatus
 from airline_saga.common.exceptions import OrchestratorException
 
 
 @pytest.fixture
-def command_args():
-    """Create mock command args for testing."""
-    args = MagicMock(spec=OrchestratorCommandArgs)
-    args.booking = MagicMock()
-    args.booking.booking_id = "test-booking-id"
-    args.booking.steps = []
-    args.flight_number = "FL123"
-    args.seat_number = "12A"
-    args.passenger_name = "John Doe"
-    args.settings = MagicMock()
-    args.settings.allocation_service_url = "http://allocation-service"
-    args.settings.payment_service_url = "http://payment-service"  # Used in undo method
-    return args
+def command_args(http_client, orchestrator_settings):
+    """Create command args with stub components for testing."""
+    return OrchestratorCommandArgs(
+        booking=SimpleNamespace(booking_id="test-booking-id", steps=[]),
+        passenger_name="John Doe",
+        flight_number="FL123",
+        seat_number="12A",
+        payment_details=None,
+        settings=orchestrator_settings,
+        http_client=http_client,
+    )
 
 
 class TestAllocateCommand:
     """Tests for the AllocateCommand class."""
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_execute_success(self, mock_client, command_args):
+    async def test_execute_success(self, command_args):
         """Test successful execution of the allocation command."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "booking_id": "test-booking-id",
-            "status": "COMPLETED",
-            "message": "Seat allocated successfully",
-            "data": {
-                "timestamp": "2023-01-01T12:00:00Z",
-                "boarding_pass": {"gate": "A1", "boarding_time": "14:30"},
-            },
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "success": True,
+                "booking_id": "test-booking-id",
+                "status": "COMPLETED",
+                "message": "Seat allocated successfully",
+                "data": {
+                    "timestamp": "2023-01-01T12:00:00Z",
+                    "boarding_pass": {"gate": "A1", "boarding_time": "14:30"},
+                },
+            }
         )
-        mock_client.return_value = mock_client_instance
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute command
         command = AllocateCommand(command_args)
         await command.execute()
 
         # Verify API call
-        mock_client_instance.__aenter__.return_value.post.assert_called_once_with(
+        command_args.http_client.post.assert_called_once_with(
             "http://allocation-service/api/allocations/allocate",
-            json={
-                "booking_id": "test-booking-id",
-                "flight_number": "FL123",
-                "seat_number": "12A",
-                "passenger_name": "John Doe",
-            },
+            content=orjson.dumps(
+                {
+                    "booking_id": "test-booking-id",
+                    "flight_number": "FL123",
+                    "seat_number": "12A",
+                    "passenger_name": "John Doe",
+                }
+            ),
+            headers=JSON_HEADERS,
         )
 
         # Verify booking step was added
@@ -83,59 +84,50 @@ class TestAllocateCommand:
             "boarding_time": "14:30",
         }
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_execute_failure(self, mock_client, command_args):
+    async def test_execute_failure(self, command_args):
         """Test failed execution of the allocation command."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "success": False,
-            "message": "Allocation failed",
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "success": False,
+                "message": "Allocation failed",
+            }
         )
-        mock_client.return_value = mock_client_instance
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute command and expect exception
         command = AllocateCommand(command_args)
         with pytest.raises(OrchestratorException, match="Failed to allocate seat"):
             await command.execute()
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_undo_success(self, mock_client, command_args):
+    async def test_undo_success(self, command_args):
         """Test successful undo of the allocation command."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.status = "CANCELLED"
-        mock_response.data = {"timestamp": "2023-01-01T12:30:00Z"}
-        mock_response.json.return_value = {
-            "success": True,
-            "booking_id": "test-booking-id",
-            "status": "CANCELLED",
-            "message": "Allocation cancelled successfully",
-            "data": {"timestamp": "2023-01-01T12:30:00Z"},
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "success": True,
+                "booking_id": "test-booking-id",
+                "status": "RELEASED",
+                "message": "Allocation cancelled successfully",
+                "data": None,
+            }
         )
-        mock_client.return_value = mock_client_instance
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute undo
         command = AllocateCommand(command_args)
         await command.undo()
 
         # Verify API call
-        mock_client_instance.__aenter__.return_value.post.assert_called_once_with(
-            "http://payment-service/api/allocations/cancel",
-            json={"booking_id": "test-booking-id"},
+        command_args.http_client.post.assert_called_once_with(
+            "http://allocation-service/api/allocations/cancel",
+            content=orjson.dumps({"booking_id": "test-booking-id"}),
+            headers=JSON_HEADERS,
         )
 
         # Verify booking step was added
@@ -143,18 +135,13 @@ class TestAllocateCommand:
         step = command_args.booking.steps[0]
         assert step.service == "allocation_service"
         assert step.operation == "cancel_seat_allocation"
-        assert step.status == "CANCELLED"
+        assert step.status == "RELEASED"
+        assert step.timestamp == ""
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_undo_exception(self, mock_client, command_args):
+    async def test_undo_exception(self, command_args):
         """Test exception handling during undo of the allocation command."""
         # Setup mock to raise exception
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            side_effect=Exception("Network error")
-        )
-        mock_client.return_value = mock_client_instance
+        command_args.http_client.post.side_effect = Exception("Network error")
 
         # Execute undo and expect exception
         command = AllocateCommand(command_args)
@@ -3,31 +3,35 @@
 import pytest
 from unittest.mock import MagicMock
 
+import httpx
+
 from airline_saga.orchestrator.services.commands import OrchestratorCommandArgs
 from airline_saga.orchestrator.services.commands.command_factory import (
     OrchestratorCommandFactory,
     OrchestratorCommandType,
 )
-from airline_saga.orchestrator.models import BookingDetails, PaymentDetails
 from airline_saga.orchestrator.services.commands.seat_command import SeatCommand
 from airline_saga.orchestrator.services.commands.payment_command import PaymentCommand
 from airline_saga.orchestrator.services.commands.allocation_command import (
     AllocateCommand,
 )
+from airline_saga.orchestrator.services.commands.command_group import (
+    OrchestratorCommandGroup,
+)
 from airline_saga.common.config import OrchestratorSettings
 
 
 @pytest.fixture
 def command_args():
     """Create mock command args for testing."""
-    # return MagicMock(spec=OrchestratorCommandArgs)
     return OrchestratorCommandArgs(
-        MagicMock(spec=BookingDetails),
+        MagicMock(),
         passenger_name="bob",
         flight_number="A123",
         seat_number="1A",
-        payment_details=MagicMock(spec=PaymentDetails),
+        payment_details=MagicMock(),
         settings=OrchestratorSettings(),
+        http_client=MagicMock(spec=httpx.AsyncClient),
     )
 
 
@@ -52,6 +56,16 @@ class TestOrchestratorCommandFactory:
         command = factory.get_command("ALLOCATION")
         assert isinstance(command, AllocateCommand)
 
+    def test_get_parallel_seat_allocation_command(self, command_args):
+        """Test getting a group running the seat and allocation commands."""
+        factory = OrchestratorCommandFactory(command_args)
+        command = factory.get_command("PARALLEL_SEAT_ALLOCATION")
+        assert isinstance(command, OrchestratorCommandGroup)
+        assert [type(grouped) for grouped in command.commands] == [
+            SeatCommand,
+            AllocateCommand,
+        ]
+
     def test_get_invalid_command(self, command_args):
         """Test getting an invalid command."""
         factory = OrchestratorCommandFactory(command_args)
@@ -68,3 +82,11 @@ class TestOrchestratorCommandFactory:
 
         assert command == mock_command.return_value
         mock_command.assert_called_once_with(command_args)
+
+    def test_custom_registry_missing_command(self, command_args):
+        """Test getting a valid command type missing from a custom registry."""
+        custom_registry = {OrchestratorCommandType.SEAT: MagicMock()}
+
+        factory = OrchestratorCommandFactory(command_args, custom_registry)
+        with pytest.raises(ValueError, match="No command found for type: PAYMENT"):
+            factory.get_command("PAYMENT")
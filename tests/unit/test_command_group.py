@@ -0,0 +1,85 @@
+"""Tests for the OrchestratorCommandGroup class."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airline_saga.common.exceptions import OrchestratorException
+from airline_saga.orchestrator.services.commands.command_group import (
+    OrchestratorCommandGroup,
+)
+
+
+@pytest.fixture
+def commands():
+    """Create mock commands for testing."""
+    first_command = MagicMock()
+    first_command.execute = AsyncMock()
+    first_command.undo = AsyncMock()
+
+    second_command = MagicMock()
+    second_command.execute = AsyncMock()
+    second_command.undo = AsyncMock()
+
+    return [first_command, second_command]
+
+
+class TestOrchestratorCommandGroup:
+    """Tests for the OrchestratorCommandGroup class."""
+
+    async def test_execute_success(self, commands):
+        """Test that every grouped command is executed."""
+        group = OrchestratorCommandGroup(commands)
+        await group.execute()
+
+        for command in commands:
+            command.execute.assert_called_once()
+            command.undo.assert_not_called()
+
+    async def test_execute_failure_undoes_succeeded_commands(self, commands):
+        """Test that a failure undoes the commands that succeeded."""
+        commands[1].execute.side_effect = OrchestratorException("Allocation failed")
+
+        group = OrchestratorCommandGroup(commands)
+        with pytest.raises(OrchestratorException, match="Allocation failed"):
+            await group.execute()
+
+        commands[0].undo.assert_called_once()
+        commands[1].undo.assert_not_called()
+
+    async def test_execute_failure_keeps_error_when_rollback_fails(self, commands):
+        """Test that a failing rollback undo does not replace the execute error."""
+        third_command = MagicMock()
+        third_command.execute = AsyncMock()
+        third_command.undo = AsyncMock()
+        commands.append(third_command)
+        commands[1].execute.side_effect = OrchestratorException("Allocation failed")
+        commands[0].undo.side_effect = OrchestratorException("Release failed")
+
+        group = OrchestratorCommandGroup(commands)
+        with pytest.raises(OrchestratorException, match="Allocation failed"):
+            await group.execute()
+
+        # Every succeeded command was still rolled back
+        commands[0].undo.assert_called_once()
+        commands[1].undo.assert_not_called()
+        third_command.undo.assert_called_once()
+
+    async def test_undo(self, commands):
+        """Test that undo is applied to every grouped command."""
+        group = OrchestratorCommandGroup(commands)
+        await group.undo()
+
+        for command in commands:
+            command.undo.assert_called_once()
+
+    async def test_undo_failure_still_undoes_other_commands(self, commands):
+        """Test that a failing undo does not stop the other undos."""
+        commands[0].undo.side_effect = OrchestratorException("Release failed")
+
+        group = OrchestratorCommandGroup(commands)
+        with pytest.raises(OrchestratorException, match="Release failed"):
+            await group.undo()
+
+        for command in commands:
+            command.undo.assert_called_once()
@@ -0,0 +1,66 @@
+"""Tests for the orchestrator's downstream HTTP helpers."""
+
+import pytest
+from unittest.mock import MagicMock
+
+import httpx
+from pydantic import ValidationError
+
+from airline_saga.common.config import OrchestratorSettings
+from airline_saga.orchestrator.services.http import JSON_HEADERS, post_json
+
+_URL = "http://seat-service/api/seats/block"
+_CONTENT = b'{"booking_id":"test-booking-id"}'
+
+
+class TestPostJson:
+    """Tests for the post_json function."""
+
+    async def test_retries_connect_timeout(self, http_client, orchestrator_settings):
+        """Test that a connect timeout is retried and the next response returned."""
+        mock_response = MagicMock()
+        http_client.post.side_effect = [
+            httpx.ConnectTimeout("Connect timed out"),
+            mock_response,
+        ]
+
+        response = await post_json(http_client, _URL, _CONTENT, orchestrator_settings)
+
+        assert response is mock_response
+        assert http_client.post.call_count == 2
+        http_client.post.assert_called_with(
+            _URL,
+            content=_CONTENT,
+            headers=JSON_HEADERS,
+        )
+
+    async def test_raises_after_exhausting_attempts(
+        self,
+        http_client,
+        orchestrator_settings,
+    ):
+        """Test that the last connection error is raised once attempts run out."""
+        http_client.post.side_effect = httpx.ConnectError("Connection refused")
+
+        with pytest.raises(httpx.ConnectError, match="Connection refused"):
+            await post_json(http_client, _URL, _CONTENT, orchestrator_settings)
+
+        assert http_client.post.call_count == orchestrator_settings.http_retry_attempts
+
+    async def test_does_not_retry_read_timeout(
+        self,
+        http_client,
+        orchestrator_settings,
+    ):
+        """Test that a read timeout, which may have reached the service, is raised."""
+        http_client.post.side_effect = httpx.ReadTimeout("Read timed out")
+
+        with pytest.raises(httpx.ReadTimeout):
+            await post_json(http_client, _URL, _CONTENT, orchestrator_settings)
+
+        assert http_client.post.call_count == 1
+
+    def test_requires_at_least_one_attempt(self):
+        """Test that the settings reject a retry count leaving no attempt."""
+        with pytest.raises(ValidationError):
+            OrchestratorSettings(http_retry_attempts=0)
@@ -1,71 +1,74 @@
 """Tests for the PaymentCommand class."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import orjson
 
 from airline_saga.orchestrator.services.commands.payment_command import PaymentCommand
 from airline_saga.orchestrator.services.commands import OrchestratorCommandArgs
+from airline_saga.orchestrator.services.http import JSON_HEADERS
 from airline_saga.common.models import TransactionStatus
 from airline_saga.common.exceptions import OrchestratorException
 
 
 @pytest.fixture
-def command_args():
-    """Create mock command args for testing."""
-    args = MagicMock(spec=OrchestratorCommandArgs)
-    args.booking = MagicMock()
-    args.booking.booking_id = "test-booking-id"
-    args.booking.steps = []
-    args.flight_number = "FL123"
-    args.seat_number = "12A"
-    args.payment_details = MagicMock()
-    args.payment_details.amount = 100.0
-    args.payment_details.currency = "USD"
-    args.payment_details.payment_method_type = "credit_card"
-    args.payment_details.payment_metadata = {"card_last4": "1234"}
-    args.settings = MagicMock()
-    args.settings.payment_service_url = "http://payment-service"
-    return args
+def command_args(http_client, orchestrator_settings):
+    """Create command args with stub components for testing."""
+    return OrchestratorCommandArgs(
+        booking=SimpleNamespace(booking_id="test-booking-id", steps=[]),
+        passenger_name="John Doe",
+        flight_number="FL123",
+        seat_number="12A",
+        payment_details=SimpleNamespace(
+            amount=100.0,
+            currency="USD",
+            payment_method_type="credit_card",
+            payment_metadata={"card_last4": "1234"},
+        ),
+        settings=orchestrator_settings,
+        http_client=http_client,
+    )
 
 
 class TestPaymentCommand:
     """Tests for the PaymentCommand class."""
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_execute_success(self, mock_client, command_args):
+    async def test_execute_success(self, command_args):
         """Test successful execution of the payment command."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "booking_id": "test-booking-id",
-            "status": "COMPLETED",
-            "message": "Payment processed successfully",
-            "data": {"timestamp": "2023-01-01T12:00:00Z"},
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "success": True,
+                "booking_id": "test-booking-id",
+                "status": "COMPLETED",
+                "message": "Payment processed successfully",
+                "data": {"timestamp": "2023-01-01T12:00:00Z"},
+            }
         )
-        mock_client.return_value = mock_client_instance
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute command
         command = PaymentCommand(command_args)
         await command.execute()
 
         # Verify API call
-        mock_client_instance.__aenter__.return_value.post.assert_called_once_with(
+        command_args.http_client.post.assert_called_once_with(
             "http://payment-service/api/payments/process",
-            json={
-                "booking_id": "test-booking-id",
-                "amount": 100.0,
-                "currency": "USD",
-                "payment_method_type": "credit_card",
-                "payment_metadata": {"card_last4": "1234"},
-            },
+            content=orjson.dumps(
+                {
+                    "booking_id": "test-booking-id",
+                    "amount": 100.0,
+                    "currency": "USD",
+                    "payment_method_type": "credit_card",
+                    "payment_metadata": {"card_last4": "1234"},
+                }
+            ),
+            headers=JSON_HEADERS,
         )
 
         # Verify booking step was added
@@ -76,23 +79,19 @@ class TestPaymentCommand:
         assert step.status == TransactionStatus.COMPLETED
         assert step.timestamp == "2023-01-01T12:00:00Z"
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_execute_failure(self, mock_client, command_args):
+    async def test_execute_failure(self, command_args):
         """Test failed execution of the payment command."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "success": False,
-            "message": "Payment declined",
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "success": False,
+                "message": "Payment declined",
+            }
         )
-        mock_client.return_value = mock_client_instance
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute command and expect exception
         command = PaymentCommand(command_args)
@@ -106,36 +105,31 @@ class TestPaymentCommand:
         assert step.operation == "process_payment"
         assert step.status == "FAILED"
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_undo_success(self, mock_client, command_args):
+    async def test_undo_success(self, command_args):
         """Test successful undo of the payment command."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.status = "REFUNDED"
-        mock_response.data = {"timestamp": "2023-01-01T12:30:00Z"}
-        mock_response.json.return_value = {
-            "success": True,
-            "booking_id": "test-booking-id",
-            "status": "REFUNDED",
-            "message": "Payment refunded successfully",
-            "data": {"timestamp": "2023-01-01T12:30:00Z"},
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "success": True,
+                "booking_id": "test-booking-id",
+                "status": "REFUNDED",
+                "message": "Payment refunded successfully",
+                "data": {"timestamp": "2023-01-01T12:30:00Z"},
+            }
         )
-        mock_client.return_value = mock_client_instance
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute undo
         command = PaymentCommand(command_args)
         await command.undo()
 
         # Verify API call
-        mock_client_instance.__aenter__.return_value.post.assert_called_once_with(
+        command_args.http_client.post.assert_called_once_with(
             "http://payment-service/api/payments/refund",
-            json={"booking_id": "test-booking-id"},
+            content=orjson.dumps({"booking_id": "test-booking-id"}),
+            headers=JSON_HEADERS,
         )
 
         # Verify booking step was added
@@ -144,17 +138,12 @@ class TestPaymentCommand:
         assert step.service == "payment_service"
         assert step.operation == "refund_payment"
         assert step.status == "REFUNDED"
+        assert step.timestamp == "2023-01-01T12:30:00Z"
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_undo_exception(self, mock_client, command_args):
+    async def test_undo_exception(self, command_args):
         """Test exception handling during undo of the payment command."""
         # Setup mock to raise exception
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            side_effect=Exception("Network error")
-        )
-        mock_client.return_value = mock_client_instance
+        command_args.http_client.post.side_effect = Exception("Network error")
 
         # Execute undo and expect exception
         command = PaymentCommand(command_args)
@@ -0,0 +1,36 @@
+"""Tests for the payment service exception handlers."""
+
+import orjson
+import pytest
+
+from airline_saga.common.exceptions import (
+    BookingNotFoundException,
+    PaymentFailedException,
+    SagaException,
+)
+from airline_saga.payment_service.exception_handlers import saga_exception_handler
+
+
+class DeclinedCardException(PaymentFailedException):
+    """Payment failure subclass without its own status code."""
+
+
+class TestSagaExceptionHandler:
+    """Tests for the saga_exception_handler function."""
+
+    @pytest.mark.parametrize(
+        "exc,expected_status",
+        [
+            (PaymentFailedException("Payment failed", booking_id="b1"), 400),
+            (DeclinedCardException("Card declined", booking_id="b1"), 400),
+            (BookingNotFoundException("No payment", booking_id="b1"), 404),
+            (SagaException("Unexpected", booking_id="b1"), 500),
+        ],
+        ids=["exact_class", "subclass", "not_found", "fallback"],
+    )
+    async def test_status_follows_class_hierarchy(self, exc, expected_status):
+        """Test that subclasses inherit the status of their closest mapped base."""
+        response = await saga_exception_handler(None, exc)
+
+        assert response.status_code == expected_status
+        assert orjson.loads(response.body)["message"] == exc.message
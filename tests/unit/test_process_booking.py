@@ -1,214 +1,167 @@
 """Tests for the process_booking function."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
 
+from airline_saga.orchestrator import main
 from airline_saga.orchestrator.main import process_booking
 from airline_saga.common.models import BookingStatus
 from airline_saga.common.exceptions import OrchestratorException
-from airline_saga.orchestrator.models import BookingDetails, PaymentDetails
-from airline_saga.common.config import OrchestratorSettings
 
 
 @pytest.fixture
 def mock_booking():
-    """Create a mock booking."""
-    booking = MagicMock(spec=BookingDetails)
-    booking.booking_id = "test-booking-id"
-    booking.status = BookingStatus.PENDING
-    booking.steps = []
-    return booking
+    """Create a stub booking."""
+    return SimpleNamespace(
+        booking_id="test-booking-id",
+        status=BookingStatus.PENDING,
+        steps=[],
+    )
 
 
-@pytest.fixture
-def mock_payment_details():
-    """Create mock payment details."""
-    payment_details = MagicMock(spec=PaymentDetails)
-    payment_details.amount = 100.0
-    payment_details.currency = "USD"
-    payment_details.payment_method_type = "credit_card"
-    payment_details.payment_metadata = {"card_last4": "1234"}
-    return payment_details
-
-
-@pytest.fixture
-def mock_settings():
-    """Create mock settings."""
-    settings = MagicMock(spec=OrchestratorSettings)
-    settings.commands = ["SEAT", "PAYMENT", "ALLOCATION"]
-    return settings
+class FastAsyncMock:
+    """Awaitable stub counting its calls, optionally raising an exception."""
 
+    def __init__(self, side_effect=None):
+        self.call_count = 0
+        self.side_effect = side_effect
 
-@pytest.fixture
-def mock_command_factory():
-    """Create a mock command factory."""
-    factory = MagicMock()
-    return factory
+    async def __call__(self, *_args, **_kwargs):
+        self.call_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
 
 
 @pytest.fixture
 def mock_commands():
-    """Create mock commands."""
-    seat_command = MagicMock()
-    seat_command.execute = AsyncMock()
-    seat_command.undo = AsyncMock()
-
-    payment_command = MagicMock()
-    payment_command.execute = AsyncMock()
-    payment_command.undo = AsyncMock()
-
-    allocation_command = MagicMock()
-    allocation_command.execute = AsyncMock()
-    allocation_command.undo = AsyncMock()
-
+    """Create stub commands."""
     return {
-        "SEAT": seat_command,
-        "PAYMENT": payment_command,
-        "ALLOCATION": allocation_command,
+        command_name: SimpleNamespace(execute=FastAsyncMock(), undo=FastAsyncMock())
+        for command_name in ("SEAT", "PAYMENT", "ALLOCATION")
     }
 
 
+@pytest.fixture
+def mock_factory(monkeypatch, mock_booking, mock_settings):
+    """Patch the orchestrator globals and yield the command factory used."""
+    factory = MagicMock()
+    mock_bookings_db = MagicMock()
+    mock_bookings_db.__getitem__.return_value = mock_booking
+
+    monkeypatch.setattr(main, "get_http_client", MagicMock())
+    monkeypatch.setattr(main, "bookings_db", mock_bookings_db)
+    monkeypatch.setattr(main, "get_settings", lambda: mock_settings)
+    monkeypatch.setattr(
+        main,
+        "OrchestratorCommandFactory",
+        MagicMock(return_value=factory),
+    )
+
+    yield factory
+    # The booking is updated in place, never stored again
+    assert not mock_bookings_db.__setitem__.called
+
+
+async def run_process_booking(payment_details):
+    """Run process_booking for the test booking."""
+    await process_booking(
+        booking_id="test-booking-id",
+        passenger_name="John Doe",
+        flight_number="FL123",
+        seat_number="12A",
+        payment_details=payment_details,
+    )
+
+
 class TestProcessBooking:
     """Tests for the process_booking function."""
 
-    @pytest.mark.asyncio
-    @patch("airline_saga.orchestrator.main.bookings_db")
-    @patch("airline_saga.orchestrator.main.get_settings")
-    @patch("airline_saga.orchestrator.main.OrchestratorCommandFactory")
-    async def test_process_booking_success(
+    @pytest.mark.parametrize(
+        "failing_command,expected_status,expected_executed,expected_undone",
+        [
+            (None, BookingStatus.COMPLETED, ["SEAT", "PAYMENT", "ALLOCATION"], []),
+            ("PAYMENT", BookingStatus.FAILED, ["SEAT", "PAYMENT"], ["SEAT"]),
+        ],
+        ids=["success", "failure_with_compensation"],
+    )
+    async def test_process_booking(
         self,
-        mock_factory_class,
-        mock_get_settings,
-        mock_bookings_db,
+        mock_factory,
         mock_booking,
         mock_payment_details,
-        mock_settings,
         mock_commands,
+        failing_command,
+        expected_status,
+        expected_executed,
+        expected_undone,
     ):
-        """Test successful booking process."""
-        # Setup mocks
-        mock_bookings_db.__getitem__.return_value = mock_booking
-        mock_get_settings.return_value = mock_settings
-
-        mock_factory = MagicMock()
-        mock_factory_class.return_value = mock_factory
+        """Test the booking process, with and without a failing command."""
+        # Make the failing command raise
+        if failing_command:
+            mock_commands[failing_command].execute.side_effect = OrchestratorException(
+                "Command failed",
+            )
 
         # Setup command factory to return our mock commands
-        def get_command_side_effect(command_name):
-            return mock_commands[command_name]
-
-        mock_factory.get_command.side_effect = get_command_side_effect
+        mock_factory.get_command.side_effect = mock_commands.__getitem__
 
         # Execute the function
-        await process_booking(
-            booking_id="test-booking-id",
-            passenger_name="John Doe",
-            flight_number="FL123",
-            seat_number="12A",
-            payment_details=mock_payment_details,
+        await run_process_booking(mock_payment_details)
+
+        # Verify commands ran in order and the ones past a failure were never built
+        assert mock_factory.get_command.call_args_list == [
+            call(command_name) for command_name in expected_executed
+        ]
+        # Compare the (execute, undo) call counts of every command at once
+        assert tuple(
+            (command.execute.call_count, command.undo.call_count)
+            for command in mock_commands.values()
+        ) == tuple(
+            (
+                int(command_name in expected_executed),
+                int(command_name in expected_undone),
+            )
+            for command_name in mock_commands
         )
 
-        # Verify all commands were executed in order
-        mock_commands["SEAT"].execute.assert_called_once()
-        mock_commands["PAYMENT"].execute.assert_called_once()
-        mock_commands["ALLOCATION"].execute.assert_called_once()
-
-        # Verify no undo operations were called
-        mock_commands["SEAT"].undo.assert_not_called()
-        mock_commands["PAYMENT"].undo.assert_not_called()
-        mock_commands["ALLOCATION"].undo.assert_not_called()
-
-        # Verify booking status was updated to COMPLETED
-        assert mock_booking.status == BookingStatus.COMPLETED
-        mock_bookings_db.__setitem__.assert_called_with("test-booking-id", mock_booking)
-
-    @pytest.mark.asyncio
-    @patch("airline_saga.orchestrator.main.bookings_db")
-    @patch("airline_saga.orchestrator.main.get_settings")
-    @patch("airline_saga.orchestrator.main.OrchestratorCommandFactory")
-    async def test_process_booking_failure_with_compensation(
+        # Verify booking status was updated
+        assert mock_booking.status == expected_status
+
+    async def test_process_booking_invalid_later_command(
         self,
-        mock_factory_class,
-        mock_get_settings,
-        mock_bookings_db,
+        mock_factory,
         mock_booking,
         mock_payment_details,
-        mock_settings,
         mock_commands,
     ):
-        """Test booking process with failure and compensation."""
-        # Setup mocks
-        mock_bookings_db.__getitem__.return_value = mock_booking
-        mock_get_settings.return_value = mock_settings
-
-        mock_factory = MagicMock()
-        mock_factory_class.return_value = mock_factory
-
-        # Make the payment command fail
-        mock_commands["PAYMENT"].execute.side_effect = OrchestratorException(
-            "Payment failed"
-        )
-
-        # Setup command factory to return our mock commands
-        def get_command_side_effect(command_name):
-            return mock_commands[command_name]
-
-        mock_factory.get_command.side_effect = get_command_side_effect
+        """Test that failing to build a later command undoes the earlier ones."""
+        # Build the seat command, then fail on an unknown command name
+        mock_factory.get_command.side_effect = [
+            mock_commands["SEAT"],
+            ValueError("Command 'PAYMNT' is not supported"),
+        ]
 
         # Execute the function
-        await process_booking(
-            booking_id="test-booking-id",
-            passenger_name="John Doe",
-            flight_number="FL123",
-            seat_number="12A",
-            payment_details=mock_payment_details,
-        )
-
-        # Verify execution order
-        mock_commands["SEAT"].execute.assert_called_once()
-        mock_commands["PAYMENT"].execute.assert_called_once()
-        mock_commands["ALLOCATION"].execute.assert_not_called()
+        await run_process_booking(mock_payment_details)
 
-        # Verify compensation was triggered for the SEAT command
-        mock_commands["SEAT"].undo.assert_called_once()
-
-        # Verify booking status was updated to FAILED
+        # Verify the blocked seat was released and the booking failed
+        assert mock_commands["SEAT"].execute.call_count == 1
+        assert mock_commands["SEAT"].undo.call_count == 1
         assert mock_booking.status == BookingStatus.FAILED
-        mock_bookings_db.__setitem__.assert_called_with("test-booking-id", mock_booking)
 
-    @pytest.mark.asyncio
-    @patch("airline_saga.orchestrator.main.bookings_db")
-    @patch("airline_saga.orchestrator.main.get_settings")
-    @patch("airline_saga.orchestrator.main.OrchestratorCommandFactory")
     async def test_process_booking_unexpected_exception(
         self,
-        mock_factory_class,
-        mock_get_settings,
-        mock_bookings_db,
+        mock_factory,
         mock_booking,
         mock_payment_details,
-        mock_settings,
     ):
         """Test booking process with an unexpected exception."""
-        # Setup mocks
-        mock_bookings_db.__getitem__.return_value = mock_booking
-        mock_get_settings.return_value = mock_settings
-
-        mock_factory = MagicMock()
-        mock_factory_class.return_value = mock_factory
-
         # Make the factory throw an unexpected exception
         mock_factory.get_command.side_effect = Exception("Unexpected error")
 
         # Execute the function
-        await process_booking(
-            booking_id="test-booking-id",
-            passenger_name="John Doe",
-            flight_number="FL123",
-            seat_number="12A",
-            payment_details=mock_payment_details,
-        )
+        await run_process_booking(mock_payment_details)
 
         # Verify booking status was updated to FAILED
         assert mock_booking.status == BookingStatus.FAILED
-        mock_bookings_db.__setitem__.assert_called_with("test-booking-id", mock_booking)
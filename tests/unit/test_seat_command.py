@@ -1,64 +1,81 @@
 """Tests for the SeatCommand class."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import orjson
 
 from airline_saga.orchestrator.services.commands.seat_command import SeatCommand
 from airline_saga.orchestrator.services.commands import OrchestratorCommandArgs
+from airline_saga.orchestrator.services.http import JSON_HEADERS
 from airline_saga.common.models import TransactionStatus
 from airline_saga.common.exceptions import OrchestratorException
 
+# Encoded seat service responses, shared by the tests since bytes are immutable
+_BLOCK_OK = orjson.dumps(
+    {
+        "success": True,
+        "booking_id": "test-booking-id",
+        "status": "COMPLETED",
+        "message": "Seat blocked successfully",
+        "data": {"timestamp": "2023-01-01T12:00:00Z"},
+    }
+)
+_BLOCK_FAILED = orjson.dumps({"success": False, "message": "Seat not available"})
+_RELEASE_OK = orjson.dumps(
+    {
+        "success": True,
+        "booking_id": "test-booking-id",
+        "status": "RELEASED",
+        "message": "Seat released successfully",
+        "data": {"timestamp": "2023-01-01T12:30:00Z"},
+    }
+)
+
 
 @pytest.fixture
-def command_args():
-    """Create mock command args for testing."""
-    args = MagicMock(spec=OrchestratorCommandArgs)
-    args.booking = MagicMock()
-    args.booking.booking_id = "test-booking-id"
-    args.booking.steps = []
-    args.flight_number = "FL123"
-    args.seat_number = "12A"
-    args.settings = MagicMock()
-    args.settings.seat_service_url = "http://seat-service"
-    return args
+def command_args(http_client, orchestrator_settings):
+    """Create command args with stub components for testing."""
+    return OrchestratorCommandArgs(
+        booking=SimpleNamespace(booking_id="test-booking-id", steps=[]),
+        passenger_name="John Doe",
+        flight_number="FL123",
+        seat_number="12A",
+        payment_details=None,
+        settings=orchestrator_settings,
+        http_client=http_client,
+    )
 
 
 class TestSeatCommand:
     """Tests for the SeatCommand class."""
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_execute_success(self, mock_client, command_args):
+    async def test_execute_success(self, command_args):
         """Test successful execution of the seat command."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "booking_id": "test-booking-id",
-            "status": "COMPLETED",
-            "message": "Seat blocked successfully",
-            "data": {"timestamp": "2023-01-01T12:00:00Z"},
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        mock_client.return_value = mock_client_instance
+        mock_response.content = _BLOCK_OK
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute command
         command = SeatCommand(command_args)
         await command.execute()
 
         # Verify API call
-        mock_client_instance.__aenter__.return_value.post.assert_called_once_with(
+        command_args.http_client.post.assert_called_once_with(
             "http://seat-service/api/seats/block",
-            json={
-                "booking_id": "test-booking-id",
-                "flight_number": "FL123",
-                "seat_number": "12A",
-            },
+            content=orjson.dumps(
+                {
+                    "booking_id": "test-booking-id",
+                    "flight_number": "FL123",
+                    "seat_number": "12A",
+                }
+            ),
+            headers=JSON_HEADERS,
         )
 
         # Verify booking step was added
@@ -69,23 +86,35 @@ class TestSeatCommand:
         assert step.status == TransactionStatus.COMPLETED
         assert step.timestamp == "2023-01-01T12:00:00Z"
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_execute_failure(self, mock_client, command_args):
+    async def test_execute_retries_connect_error(self, command_args):
+        """Test that a connection error is retried before giving up."""
+        # Setup mock response
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = _BLOCK_OK
+
+        command_args.http_client.post.side_effect = [
+            httpx.ConnectError("Connection refused"),
+            mock_response,
+        ]
+
+        # Execute command
+        command = SeatCommand(command_args)
+        await command.execute()
+
+        # Verify the call was retried once and the step recorded
+        assert command_args.http_client.post.call_count == 2
+        assert len(command_args.booking.steps) == 1
+        assert command_args.booking.steps[0].status == TransactionStatus.COMPLETED
+
+    async def test_execute_failure(self, command_args):
         """Test failed execution of the seat command."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "success": False,
-            "message": "Seat not available",
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        mock_client.return_value = mock_client_instance
+        mock_response.content = _BLOCK_FAILED
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute command and expect exception
         command = SeatCommand(command_args)
@@ -99,34 +128,23 @@ class TestSeatCommand:
         assert step.operation == "block_seat"
         assert step.status == "FAILED"
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_undo_success(self, mock_client, command_args):
+    async def test_undo_success(self, command_args):
         """Test successful undo of the seat command."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "booking_id": "test-booking-id",
-            "status": "RELEASED",
-            "message": "Seat released successfully",
-            "data": {"timestamp": "2023-01-01T12:30:00Z"},
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        mock_client.return_value = mock_client_instance
+        mock_response.content = _RELEASE_OK
+
+        command_args.http_client.post.return_value = mock_response
 
         # Execute undo
         command = SeatCommand(command_args)
         await command.undo()
 
         # Verify API call
-        mock_client_instance.__aenter__.return_value.post.assert_called_once_with(
+        command_args.http_client.post.assert_called_once_with(
             "http://seat-service/api/seats/release",
-            json={"booking_id": "test-booking-id"},
+            content=orjson.dumps({"booking_id": "test-booking-id"}),
+            headers=JSON_HEADERS,
         )
 
         # Verify booking step was added
@@ -137,16 +155,10 @@ class TestSeatCommand:
         assert step.status == "RELEASED"
         assert step.timestamp == "2023-01-01T12:30:00Z"
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_undo_exception(self, mock_client, command_args):
+    async def test_undo_exception(self, command_args):
         """Test exception handling during undo of the seat command."""
         # Setup mock to raise exception
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.post = AsyncMock(
-            side_effect=Exception("Network error")
-        )
-        mock_client.return_value = mock_client_instance
+        command_args.http_client.post.side_effect = Exception("Network error")
 
         # Execute undo and expect exception
         command = SeatCommand(command_args)
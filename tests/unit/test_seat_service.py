@@ -0,0 +1,70 @@
+"""Tests for the seat service API."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from airline_saga.seat_service.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client running the service lifespan on fresh sample data."""
+    with TestClient(app) as client:
+        yield client
+
+
+def _seat_statuses(client, status=None):
+    """Get the seat number and status of the FL001 seats, optionally filtered."""
+    params = {"status": status} if status else None
+    response = client.get("/api/flights/FL001", params=params)
+    assert response.status_code == 200
+    return [(seat["seat_number"], seat["status"]) for seat in response.json()["seats"]]
+
+
+class TestSeatService:
+    """Tests for the seat service API."""
+
+    def test_flight_responses_follow_seat_changes(self, client):
+        """Test that cached flight responses are refreshed on block and release."""
+        assert _seat_statuses(client, "available") == [
+            ("1A", "available"),
+            ("2A", "available"),
+            ("2B", "available"),
+            ("2C", "available"),
+        ]
+        assert ("1A", "available") in _seat_statuses(client)
+
+        # Block a seat
+        response = client.post(
+            "/api/seats/block",
+            json={
+                "booking_id": "test-booking-id",
+                "flight_number": "FL001",
+                "seat_number": "1A",
+            },
+        )
+        assert response.status_code == 200
+
+        assert _seat_statuses(client, "available") == [
+            ("2A", "available"),
+            ("2B", "available"),
+            ("2C", "available"),
+        ]
+        assert ("1A", "blocked") in _seat_statuses(client)
+        assert ("1A", "blocked") in _seat_statuses(client, "blocked")
+
+        # Release it again
+        response = client.post(
+            "/api/seats/release",
+            json={"booking_id": "test-booking-id"},
+        )
+        assert response.status_code == 200
+
+        assert _seat_statuses(client, "available") == [
+            ("1A", "available"),
+            ("2A", "available"),
+            ("2B", "available"),
+            ("2C", "available"),
+        ]
+        assert ("1A", "available") in _seat_statuses(client)
+        assert ("1A", "blocked") not in _seat_statuses(client, "blocked")
@@ -0,0 +1,66 @@
+"""Tests for the ShardedStore class."""
+
+import pytest
+
+from airline_saga.common.store import ShardedStore
+
+
+@pytest.fixture
+def store():
+    """Create a store holding a few values spread over its shards."""
+    store = ShardedStore(shard_count=4)
+    for index in range(10):
+        store[f"booking-{index}"] = index
+    return store
+
+
+class TestShardedStore:
+    """Tests for the ShardedStore class."""
+
+    @pytest.mark.parametrize("shard_count", [0, -4, 3, 6])
+    def test_rejects_shard_count_not_power_of_two(self, shard_count):
+        """Test that the shard count must be a power of two."""
+        with pytest.raises(ValueError, match="must be a power of two"):
+            ShardedStore(shard_count=shard_count)
+
+    @pytest.mark.parametrize("shard_count", [1, 2, 16])
+    def test_accepts_power_of_two_shard_count(self, shard_count):
+        """Test that any power of two is a valid shard count."""
+        assert len(ShardedStore(shard_count=shard_count)) == 0
+
+    def test_get_and_getitem(self, store):
+        """Test looking up stored and missing keys."""
+        assert store.get("booking-3") == 3
+        assert store["booking-3"] == 3
+        assert store.get("missing") is None
+        with pytest.raises(KeyError):
+            store["missing"]
+
+    def test_setitem_replaces_value(self, store):
+        """Test that storing an existing key replaces its value."""
+        store["booking-3"] = 30
+
+        assert store["booking-3"] == 30
+        assert len(store) == 10
+
+    def test_contains(self, store):
+        """Test membership of stored, missing and non-string keys."""
+        assert "booking-3" in store
+        assert "missing" not in store
+        assert 3 not in store
+
+    def test_len_and_iter(self, store):
+        """Test that every key is counted and iterated once across the shards."""
+        assert len(store) == 10
+        assert sorted(store) == sorted(f"booking-{index}" for index in range(10))
+
+    def test_items_is_a_snapshot(self, store):
+        """Test that items can be iterated while the store is updated."""
+        items = store.items()
+        for key, value in items:
+            store[f"{key}-copy"] = value
+
+        assert sorted(items) == sorted(
+            (f"booking-{index}", index) for index in range(10)
+        )
+        assert len(store) == 20